@@ -0,0 +1,115 @@
+"""
+Field Cache
+
+Serves stored tournament fields from an in-instance LRU cache. Each cached
+response is kept pre-serialized (plain and gzip'd) with an ETag derived
+from the content hash the writer stores. Once an entry's TTL expires it is
+revalidated by reading only that hash, and reloaded only if it changed.
+If Firestore is unavailable, the stale entry keeps being served.
+"""
+
+from google.cloud import firestore
+import gzip
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+from src.tournament_field.firestore_client import (
+    get_tournament_field, get_tournament_field_hash, get_field_version
+)
+from src.utils.cache.lru_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+field_cache = LRUCache(max_entries=64, max_bytes=32 * 1024 * 1024, ttl_seconds=60)
+
+
+class CachedField:
+    """Pre-serialized field response"""
+
+    __slots__ = ("content_hash", "etag", "body", "gzip_body")
+
+    def __init__(self, content_hash: str, body: bytes):
+        self.content_hash = content_hash
+        self.etag = f'"{content_hash}"'
+        self.body = body
+        self.gzip_body = gzip.compress(body)
+
+
+def load_field(db: firestore.Client, tournament_id: str) -> Optional[CachedField]:
+    """Read a stored field from Firestore and serialize it for serving"""
+    doc = get_tournament_field(db, tournament_id, raise_errors=True)
+    if not doc:
+        return None
+    body = json.dumps(doc, default=str, separators=(",", ":")).encode("utf-8")
+    return CachedField(doc.get("content_hash") or get_field_version(doc.get("field")), body)
+
+
+def get_cached_field(db: firestore.Client, tournament_id: str) -> Optional[CachedField]:
+    """
+    Get a field from the cache, revalidating or reloading it when stale.
+
+    Args:
+        db: Initialized Firestore client
+        tournament_id: Tournament identifier
+
+    Returns:
+        CachedField or None if the field does not exist
+
+    Raises:
+        Exception: If Firestore fails and nothing is cached for the tournament
+    """
+    entry = field_cache.get(tournament_id)
+    if entry and entry.fresh:
+        return entry.value
+
+    try:
+        if entry and get_tournament_field_hash(db, tournament_id, raise_errors=True) == entry.value.content_hash:
+            field_cache.refresh(tournament_id)
+            return entry.value
+
+        cached = load_field(db, tournament_id)
+    except Exception as e:
+        if not entry:
+            raise
+        logger.warning(f"Serving stale field for tournament {tournament_id}: {str(e)}")
+        return entry.value
+
+    if cached:
+        field_cache.set(tournament_id, cached, len(cached.body) + len(cached.gzip_body))
+    else:
+        field_cache.invalidate(tournament_id)
+    return cached
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches the current ETag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def build_field_response(
+    cached: CachedField,
+    if_none_match: Optional[str] = None,
+    accept_encoding: Optional[str] = None
+) -> Tuple[bytes, int, Dict[str, Any]]:
+    """
+    Build the HTTP response for a cached field.
+
+    Returns:
+        Tuple of (body, status_code, headers)
+    """
+    headers = {
+        "ETag": cached.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding"
+    }
+    if etag_matches(if_none_match, cached.etag):
+        return b"", 304, headers
+
+    headers["Content-Type"] = "application/json"
+    if accept_encoding and "gzip" in accept_encoding.lower():
+        headers["Content-Encoding"] = "gzip"
+        return cached.gzip_body, 200, headers
+    return cached.body, 200, headers
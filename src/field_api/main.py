@@ -0,0 +1,42 @@
+"""
+Tournament Field Read API
+
+Cloud Function that serves stored tournament field data:
+1. Looks up the field in the in-instance cache (revalidated against the stored hash)
+2. Returns 304 when the client's ETag is current
+3. Otherwise returns the field as JSON, gzip'd when accepted
+"""
+
+import functions_framework
+from google.cloud import firestore
+import logging
+from typing import Any, Dict, Tuple
+from .field_cache import get_cached_field, build_field_response
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+db = firestore.Client()
+
+@functions_framework.http
+def get_tournament_field(request) -> Tuple[Any, int, Dict[str, Any]]:
+    """Cloud Function entry point for reading tournament field data"""
+    tournament_id = request.args.get("tournament_id")
+    if not tournament_id:
+        return {'status': 'error', 'message': 'tournament_id is required'}, 400, {}
+
+    try:
+        cached = get_cached_field(db, tournament_id)
+        if not cached:
+            return {'status': 'error', 'message': f'No field found for tournament {tournament_id}'}, 404, {}
+
+        return build_field_response(
+            cached,
+            request.headers.get("If-None-Match"),
+            request.headers.get("Accept-Encoding")
+        )
+
+    except Exception as e:
+        logger.error(f"Error serving tournament field: {str(e)}")
+        return {'status': 'error', 'message': str(e)}, 500, {}
@@ -0,0 +1,171 @@
+"""
+Field Index
+
+In-memory index of the current field for pick validation. Each tournament's
+field is loaded once into golfer-ID sets plus its lock time, then reused
+for every pick until the field pipeline publishes a new version.
+"""
+
+from google.cloud import firestore
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from src.models import Tournament, TournamentGolfer
+from src.tournament_field.firestore_client import get_published_field_version
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the published field version
+VERSION_CHECK_INTERVAL = 30
+
+
+class FieldIndex:
+    """Golfer-ID sets for one tournament's current field"""
+
+    __slots__ = ("tournament_id", "version", "lock_at", "active", "alternates", "inactive", "checked_at")
+
+    def __init__(self, tournament_id: int, version: Optional[str], lock_at: datetime,
+                 active: frozenset, alternates: frozenset, inactive: frozenset):
+        self.tournament_id = tournament_id
+        self.version = version
+        self.lock_at = lock_at
+        self.active = active
+        self.alternates = alternates
+        self.inactive = inactive
+        self.checked_at = time.monotonic()
+
+    def check(self, golfer_id: str, now: datetime) -> Optional[str]:
+        """Return the reason a pick of this golfer is invalid, or None if it is valid"""
+        if now >= self.lock_at:
+            return "tournament_locked"
+        if golfer_id in self.active:
+            return None
+        if golfer_id in self.alternates:
+            return "golfer_is_alternate"
+        if golfer_id in self.inactive:
+            return "golfer_withdrawn"
+        return "not_in_field"
+
+
+def get_lock_time(tournament: Tournament) -> datetime:
+    """Tournament start (picks lock) as a UTC datetime"""
+    local_start = datetime.combine(tournament.start_date, tournament.start_time)
+    return local_start.replace(tzinfo=ZoneInfo(tournament.time_zone)).astimezone(timezone.utc)
+
+
+def load_field_index(session, tournament_id: int, version: Optional[str] = None) -> Optional[FieldIndex]:
+    """
+    Build a field index from the most recent tournament_golfer rows.
+
+    Args:
+        session: SQLAlchemy session
+        tournament_id: Tournament ID in our database
+        version: Published field version the index corresponds to
+
+    Returns:
+        FieldIndex or None if the tournament does not exist
+    """
+    tournament = session.get(Tournament, tournament_id)
+    if not tournament:
+        logger.warning(f"Tournament {tournament_id} not found")
+        return None
+
+    rows = (
+        session.query(TournamentGolfer.golfer_id, TournamentGolfer.is_active, TournamentGolfer.is_alternate)
+        .filter(TournamentGolfer.tournament_id == tournament_id)
+        .filter(TournamentGolfer.is_most_recent.is_(True))
+        .all()
+    )
+    active, alternates, inactive = set(), set(), set()
+    for golfer_id, is_active, is_alternate in rows:
+        if not is_active:
+            inactive.add(golfer_id)
+        elif is_alternate:
+            alternates.add(golfer_id)
+        else:
+            active.add(golfer_id)
+
+    logger.info(f"Loaded field index for tournament {tournament_id} ({len(rows)} entries, version {version})")
+    return FieldIndex(
+        tournament_id, version, get_lock_time(tournament),
+        frozenset(active), frozenset(alternates), frozenset(inactive)
+    )
+
+
+_indexes: Dict[int, FieldIndex] = {}
+_tournament_locks: Dict[int, threading.Lock] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_tournament_lock(tournament_id: int) -> threading.Lock:
+    """Per-tournament lock so one reload does not hold up other tournaments"""
+    with _indexes_lock:
+        return _tournament_locks.setdefault(tournament_id, threading.Lock())
+
+
+def _is_fresh(index: Optional[FieldIndex]) -> bool:
+    return bool(index) and time.monotonic() - index.checked_at < VERSION_CHECK_INTERVAL
+
+
+def get_field_index(session, db: firestore.Client, tournament_id: int) -> Optional[FieldIndex]:
+    """
+    Get the cached field index for a tournament, reloading it when a new
+    field version has been published.
+
+    Only callers for the same tournament wait on a version check or reload.
+
+    Args:
+        session: SQLAlchemy session
+        db: Initialized Firestore client
+        tournament_id: Tournament ID in our database
+
+    Returns:
+        FieldIndex or None if the tournament does not exist
+    """
+    index = _indexes.get(tournament_id)
+    if _is_fresh(index):
+        return index
+
+    with _get_tournament_lock(tournament_id):
+        # Another caller may have refreshed the index while we waited
+        index = _indexes.get(tournament_id)
+        if _is_fresh(index):
+            return index
+
+        version = get_published_field_version(db, str(tournament_id))
+        if index and version == index.version:
+            index.checked_at = time.monotonic()
+            return index
+
+        index = load_field_index(session, tournament_id, version)
+        if index:
+            with _indexes_lock:
+                _indexes[tournament_id] = index
+        return index
+
+
+def validate_picks(
+    index: Optional[FieldIndex],
+    picks: List[Dict[str, Any]],
+    now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate a batch of picks against a field index.
+
+    Args:
+        index: FieldIndex for the tournament, or None if it does not exist
+        picks: Pick dicts with pick_id and golfer_id
+        now: Time to check lock against (defaults to current UTC time)
+
+    Returns:
+        One result dict per pick with pick_id, valid and reason
+    """
+    now = now or datetime.now(timezone.utc)
+    results = []
+    for pick in picks:
+        reason = "unknown_tournament" if index is None else index.check(str(pick.get("golfer_id")), now)
+        results.append({"pick_id": pick.get("pick_id"), "valid": reason is None, "reason": reason})
+    return results
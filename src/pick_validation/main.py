@@ -0,0 +1,79 @@
+"""
+Pick Validation Controller
+
+Cloud Function that validates a batch of user picks for one tournament:
+1. Gets the in-memory field index (reloaded when a new field version is published)
+2. Checks each pick against the field and the tournament lock time
+3. Returns a result per pick
+"""
+
+import functions_framework
+from google.cloud import firestore
+from sqlalchemy.orm import Session
+import logging
+from typing import Dict, Any, List, Tuple
+from src.utils.config.config import get_config
+from src.utils.db.db_connector import get_db_connection
+from .field_index import get_field_index, validate_picks
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fail fast on cold start if required configuration is missing
+get_config().validate("db")
+
+# Clients are created once per instance and reused across requests
+db = firestore.Client()
+db_engine = get_db_connection()
+
+def validate_picks_data(tournament_id: int, picks: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], int]:
+    """
+    Main controller function for validating picks.
+
+    Args:
+        tournament_id: Tournament ID in our database
+        picks: Pick dicts with pick_id and golfer_id
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    try:
+        with Session(db_engine) as session:
+            index = get_field_index(session, db, tournament_id)
+
+        if not index:
+            return {
+                'status': 'error',
+                'message': f'Tournament {tournament_id} not found'
+            }, 404
+
+        return {
+            'status': 'success',
+            'field_version': index.version,
+            'results': validate_picks(index, picks)
+        }, 200
+
+    except Exception as e:
+        logger.error(f"Error validating picks: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+@functions_framework.http
+def validate_tournament_picks(request) -> Tuple[Dict[str, Any], int]:
+    """Cloud Function entry point for validating picks"""
+    body = request.get_json(silent=True) or {}
+    try:
+        tournament_id = int(body["tournament_id"])
+    except (KeyError, TypeError, ValueError):
+        tournament_id = None
+    if tournament_id is None or not isinstance(body.get("picks"), list):
+        return {
+            'status': 'error',
+            'message': 'Request body must include a numeric tournament_id and a list of picks'
+        }, 400
+
+    response, status_code = validate_picks_data(tournament_id, body["picks"])
+    return response, status_code
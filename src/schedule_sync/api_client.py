@@ -0,0 +1,47 @@
+"""
+SportContent Schedule Client
+
+Handles fetching the season schedule (fixtures) for a tour from the
+SportContent Golf API. Requests share the "sportcontent" budget with the
+field updates.
+"""
+import requests
+import logging
+from typing import Dict, Any
+from src.utils.headers.headers import get_sportcontentapi_headers
+from src.utils.rate_limit.rate_limiter import get_api_budget
+
+logger = logging.getLogger(__name__)
+
+# API Configuration
+SPORTCONTENTAPI_FIXTURES_URL = "https://golf-leaderboard-data.p.rapidapi.com/fixtures"
+
+def fetch_schedule(tour_id: int, season: int) -> Dict[str, Any]:
+    """
+    Fetch the season schedule for a tour from SportContent API.
+
+    Args:
+        tour_id: SportContent API tour identifier
+        season: Season year
+
+    Returns:
+        Dict containing the schedule, with one tournament object per event in "results"
+
+    Raises:
+        QuotaExceededError: If the daily SportContent quota is used up
+        requests.exceptions.RequestException: If API request fails
+    """
+    logger.info(f"Fetching {season} schedule for tour {tour_id}")
+    get_api_budget("sportcontent").acquire()
+
+    try:
+        response = requests.get(
+            f"{SPORTCONTENTAPI_FIXTURES_URL}/{tour_id}/{season}",
+            headers=get_sportcontentapi_headers()
+        )
+        response.raise_for_status()
+        return response.json()
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Error fetching schedule: {str(e)}")
+        raise
@@ -0,0 +1,202 @@
+"""
+Schedule Database Client
+
+Maps SportContent schedule events onto Tournament rows and keeps them in
+sync with one read query and a single bulk upsert of changed events.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import date, datetime
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import logging
+from src.models import Tournament
+
+logger = logging.getLogger(__name__)
+
+# Columns owned by the schedule sync; anything else (datagolf_id, is_major,
+# coordinates, start_time) is left as maintained elsewhere
+SYNC_COLUMNS = (
+    "sportcontent_api_tour_id",
+    "year",
+    "tournament_name",
+    "tournament_format",
+    "start_date",
+    "end_date",
+    "time_zone",
+    "location_raw",
+    "course_name",
+    "city",
+    "state",
+)
+
+# Columns the schedule often cannot fill; a stored value is kept rather than
+# overwritten with None
+KEEP_IF_MISSING = ("city", "state")
+
+def parse_location(location_raw: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a SportContent location into city and state.
+
+    SportContent sends the location as "City, Country" (e.g. "Fort Worth,
+    USA"), which carries no state, so state is only filled when the location
+    has one ("City, ST" or "City, State, Country"). Otherwise it is left for
+    manual entry and preserved by the sync.
+
+    Returns:
+        Tuple of (city, state), either of which may be None
+    """
+    parts = [part.strip() for part in (location_raw or "").split(",") if part.strip()]
+    if not parts:
+        return None, None
+    if len(parts) >= 3:
+        return parts[0], parts[1]
+    if len(parts) == 2 and len(parts[1]) == 2 and parts[1].isupper():
+        return parts[0], parts[1]
+    return parts[0], None
+
+def parse_date(value: Optional[str]) -> Optional[date]:
+    """Parse a SportContent "YYYY-MM-DD HH:MM:SS" timestamp into a date"""
+    if not value:
+        return None
+    return datetime.strptime(value[:10], "%Y-%m-%d").date()
+
+def truncate(column: str, value: Any) -> Any:
+    """Clip strings to the column length so strict SQL modes accept them"""
+    length = getattr(Tournament.__table__.c[column].type, "length", None)
+    if isinstance(value, str) and length:
+        return value[:length]
+    return value
+
+def parse_schedule(schedule_data: Dict[str, Any], tour_id: int) -> List[Dict[str, Any]]:
+    """
+    Convert a SportContent schedule into Tournament row dicts.
+
+    Args:
+        schedule_data: Schedule from fetch_schedule
+        tour_id: SportContent API tour identifier
+
+    Returns:
+        Row dicts keyed by sportcontent_api_id plus SYNC_COLUMNS
+    """
+    rows = []
+    for event in schedule_data.get("results") or []:
+        start_date = parse_date(event.get("start_date"))
+        if not event.get("id") or not start_date:
+            logger.warning(f"Skipping schedule event without id or start date: {event.get('name')}")
+            continue
+
+        location_raw = event.get("country")
+        city, state = parse_location(location_raw)
+        row = {
+            "sportcontent_api_id": int(event["id"]),
+            "sportcontent_api_tour_id": tour_id,
+            "year": start_date.year,
+            "tournament_name": event.get("name"),
+            "tournament_format": (event.get("type") or "stroke").split()[0].lower(),
+            "start_date": start_date,
+            "end_date": parse_date(event.get("end_date")) or start_date,
+            "time_zone": event.get("timezone") or "America/New_York",
+            "location_raw": location_raw,
+            "course_name": event.get("course"),
+            "city": city,
+            "state": state,
+        }
+        rows.append({column: truncate(column, value) for column, value in row.items()})
+    return rows
+
+def get_existing_tournaments(session, sportcontent_api_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Load the synced columns of existing tournaments in one query.
+
+    Returns:
+        Dict mapping sportcontent_api_id to its current column values
+    """
+    columns = [getattr(Tournament, column) for column in SYNC_COLUMNS]
+    result = session.execute(
+        select(Tournament.sportcontent_api_id, *columns)
+        .where(Tournament.sportcontent_api_id.in_(list(sportcontent_api_ids)))
+    )
+    return {
+        api_id: dict(zip(SYNC_COLUMNS, values))
+        for api_id, *values in result
+    }
+
+def diff_schedule(
+    existing: Dict[int, Dict[str, Any]],
+    rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Return the rows that are new or differ from the stored tournament.
+
+    Stored KEEP_IF_MISSING values are carried into rows that lack them, so
+    they are neither counted as changes nor cleared by the upsert.
+    """
+    changed = []
+    for row in rows:
+        current = existing.get(row["sportcontent_api_id"])
+        if current is not None:
+            for column in KEEP_IF_MISSING:
+                if row[column] is None:
+                    row[column] = current[column]
+        if current is None or any(current[column] != row[column] for column in SYNC_COLUMNS):
+            changed.append(row)
+    return changed
+
+def upsert_tournaments(session, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert or update tournaments with a single statement keyed on sportcontent_api_id.
+
+    Uses ON DUPLICATE KEY UPDATE on MySQL (Cloud SQL) and ON CONFLICT on
+    SQLite. Does not commit.
+
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+
+    if session.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(Tournament).values(rows)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in SYNC_COLUMNS})
+    else:
+        stmt = sqlite_insert(Tournament).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Tournament.sportcontent_api_id],
+            set_={column: stmt.excluded[column] for column in SYNC_COLUMNS}
+        )
+    session.execute(stmt)
+    return len(rows)
+
+def sync_schedule(session, rows: List[Dict[str, Any]]) -> Optional[Dict[str, int]]:
+    """
+    Write schedule rows that changed since the last sync.
+
+    Args:
+        session: SQLAlchemy session
+        rows: Row dicts from parse_schedule, across all tours
+
+    Returns:
+        Dict with fetched/created/updated/unchanged counts, None if failed
+    """
+    logger.info(f"Syncing {len(rows)} schedule events")
+
+    try:
+        existing = get_existing_tournaments(session, [row["sportcontent_api_id"] for row in rows])
+        changed = diff_schedule(existing, rows)
+        upsert_tournaments(session, changed)
+        session.commit()
+
+        created = sum(1 for row in changed if row["sportcontent_api_id"] not in existing)
+        return {
+            "fetched": len(rows),
+            "created": created,
+            "updated": len(changed) - created,
+            "unchanged": len(rows) - len(changed)
+        }
+
+    except Exception as e:
+        logger.error(f"Error syncing tournament schedule: {str(e)}")
+        session.rollback()
+        return None
@@ -0,0 +1,93 @@
+"""
+Schedule Sync Controller
+
+Cloud Function that keeps the Tournament table in step with the season
+schedule:
+1. Fetches the schedule for each configured SportContent tour
+2. Parses events into Tournament rows (location_raw -> city/state)
+3. Diffs against existing rows with a single read query
+4. Applies one bulk upsert for new and changed events only
+"""
+
+import functions_framework
+from google.cloud import firestore
+from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from src.utils.config.config import get_config
+from src.utils.db.db_connector import get_db_connection
+from src.utils.rate_limit.rate_limiter import use_firestore_quotas
+from .api_client import fetch_schedule
+from .db_client import parse_schedule, sync_schedule
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Fail fast on cold start if required configuration is missing
+config = get_config()
+config.validate("db", "sportcontent")
+
+# SportContent tour IDs to sync (2 = PGA Tour)
+DEFAULT_TOUR_IDS = "2"
+
+def get_tour_ids() -> List[int]:
+    """Parse the comma-separated SCHEDULE_TOUR_IDS setting"""
+    value = config.get("SCHEDULE_TOUR_IDS") or DEFAULT_TOUR_IDS
+    return [int(tour_id) for tour_id in value.split(",") if tour_id.strip()]
+
+def sync_schedule_data(season: Optional[int] = None) -> Tuple[Dict[str, Any], int]:
+    """
+    Main controller function for syncing the season schedule.
+
+    Args:
+        season: Season year, defaults to the current year
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    try:
+        season = season or datetime.now(timezone.utc).year
+        logger.info(f"Starting {season} schedule sync")
+        use_firestore_quotas(firestore.Client())
+
+        rows = []
+        for tour_id in get_tour_ids():
+            rows.extend(parse_schedule(fetch_schedule(tour_id, season), tour_id))
+
+        if not rows:
+            return {
+                'status': 'error',
+                'message': f'No schedule events found for {season}'
+            }, 404
+
+        with Session(get_db_connection()) as session:
+            summary = sync_schedule(session, rows)
+
+        if not summary:
+            return {
+                'status': 'error',
+                'message': 'Failed to sync tournament schedule'
+            }, 500
+
+        return {
+            'status': 'success',
+            'message': f'Schedule synced for {season}',
+            **summary,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }, 200
+
+    except Exception as e:
+        logger.error(f"Error syncing schedule: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+@functions_framework.http
+def sync_tournament_schedule(request) -> Tuple[Dict[str, Any], int]:
+    """Cloud Function entry point for syncing the season schedule (optional ?season=)"""
+    season = request.args.get("season", type=int)
+    response, status_code = sync_schedule_data(season)
+    return response, status_code
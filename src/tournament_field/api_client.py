@@ -4,17 +4,16 @@ SportContent API Client
 Handles fetching tournament field data from the SportContent Golf API.
 Maintains consistent error handling and logging patterns with the existing codebase.
 """
-import os
 import requests
 import logging
 from typing import Dict, Any
-from src.utils.headers.headers import sportcontentapi_headers
+from src.utils.headers.headers import get_sportcontentapi_headers
+from src.utils.rate_limit.rate_limiter import get_api_budget
 
 logger = logging.getLogger(__name__)
 
 # API Configuration
 SPORTCONTENTAPI_URL = "https://golf-leaderboard-data.p.rapidapi.com/entry-list"
-HEADERS = sportcontentapi_headers
 
 def fetch_tournament_field(tournament_id: str) -> Dict[str, Any]:
     """
@@ -27,14 +26,16 @@ def fetch_tournament_field(tournament_id: str) -> Dict[str, Any]:
         Dict containing tournament field data or None if request fails
         
     Raises:
+        QuotaExceededError: If the daily SportContent quota is used up
         requests.exceptions.RequestException: If API request fails
     """
     logger.info(f"Fetching tournament field for tournament {tournament_id}")
+    get_api_budget("sportcontent").acquire()
     
     try:
         response = requests.get(
             SPORTCONTENTAPI_URL,
-            headers=HEADERS,
+            headers=get_sportcontentapi_headers(),
             params={"tournamentId": tournament_id}
         )
         response.raise_for_status()
@@ -0,0 +1,218 @@
+"""
+Tournament Field Backfill
+
+Batch entry point for rebuilding tournament_golfer rows for past seasons:
+1. Walks Tournament rows for a year range
+2. Fetches fields with a thread pool (or replays archived payloads); requests
+   are rate limited by the shared SportContent API budget and count
+   against the same Firestore daily quota as the deployed functions
+3. Writes each field with a single bulk insert
+4. Checkpoints completed tournaments so an interrupted run can resume
+
+Usage:
+    python -m src.tournament_field.backfill --start-year 2021 --end-year 2023
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Set
+from sqlalchemy.orm import Session
+from src.models import Tournament
+from .api_client import fetch_tournament_field
+from .db_client import get_golfer_id_map, bulk_insert_tournament_entries
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def load_checkpoint(path: Optional[str]) -> Set[int]:
+    """Load the set of already completed tournament IDs"""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return set(json.load(f).get("completed", []))
+
+
+def save_checkpoint(path: Optional[str], completed: Set[int]) -> None:
+    """Atomically write completed tournament IDs to the checkpoint file"""
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"completed": sorted(completed)}, f)
+    os.replace(tmp_path, path)
+
+
+def archive_path(archive_dir: str, sportcontent_api_id: Any) -> str:
+    """Path of the archived payload for a tournament"""
+    return os.path.join(archive_dir, f"{sportcontent_api_id}.json")
+
+
+def load_archived_field(archive_dir: str, sportcontent_api_id: Any) -> Dict[str, Any]:
+    """Read an archived SportContent payload from disk"""
+    with open(archive_path(archive_dir, sportcontent_api_id)) as f:
+        return json.load(f)
+
+
+def archive_field(archive_dir: str, sportcontent_api_id: Any, field_data: Dict[str, Any]) -> None:
+    """Write a SportContent payload to the archive directory"""
+    os.makedirs(archive_dir, exist_ok=True)
+    with open(archive_path(archive_dir, sportcontent_api_id), "w") as f:
+        json.dump(field_data, f)
+
+
+def get_tournaments_for_years(session, start_year: int, end_year: int) -> List[Dict[str, Any]]:
+    """
+    Get all tournaments with a SportContent ID in a year range.
+
+    Args:
+        session: SQLAlchemy session
+        start_year: First season (inclusive)
+        end_year: Last season (inclusive)
+
+    Returns:
+        List of tournament info dicts ordered by start date
+    """
+    rows = (
+        session.query(Tournament.id, Tournament.sportcontent_api_id, Tournament.year)
+        .filter(Tournament.year.between(start_year, end_year))
+        .filter(Tournament.sportcontent_api_id.isnot(None))
+        .order_by(Tournament.start_date)
+        .all()
+    )
+    return [
+        {"id": t_id, "sportcontent_api_id": api_id, "year": year}
+        for t_id, api_id, year in rows
+    ]
+
+
+def backfill_tournament_fields(
+    session,
+    start_year: int,
+    end_year: int,
+    fetch: Callable[[Any], Dict[str, Any]] = fetch_tournament_field,
+    checkpoint_path: Optional[str] = None,
+    archive_dir: Optional[str] = None,
+    replay: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Any]:
+    """
+    Rebuild tournament_golfer rows for every tournament in a year range.
+
+    Fetches run concurrently; writes happen on the calling thread, one
+    transaction per tournament, followed by a checkpoint update.
+
+    Args:
+        session: SQLAlchemy session
+        start_year: First season (inclusive)
+        end_year: Last season (inclusive)
+        fetch: Callable returning a SportContent payload for a tournament ID
+        checkpoint_path: JSON file recording completed tournament IDs
+        archive_dir: Directory to write fetched payloads to (or read from when replaying)
+        replay: Read payloads from archive_dir instead of calling the API
+        max_workers: Size of the fetch thread pool
+
+    Returns:
+        Summary dict with processed/skipped/failed counts and throughput
+    """
+    if replay and not archive_dir:
+        raise ValueError("archive_dir is required when replaying archived payloads")
+
+    started = time.monotonic()
+    completed = load_checkpoint(checkpoint_path)
+    tournaments = get_tournaments_for_years(session, start_year, end_year)
+    pending = [t for t in tournaments if t["id"] not in completed]
+    logger.info(
+        f"Backfilling {len(pending)} tournaments for {start_year}-{end_year} "
+        f"({len(tournaments) - len(pending)} already checkpointed)"
+    )
+
+    golfers = get_golfer_id_map(session)
+
+    def load(tournament: Dict[str, Any]) -> Dict[str, Any]:
+        api_id = tournament["sportcontent_api_id"]
+        if replay:
+            return load_archived_field(archive_dir, api_id)
+        field_data = fetch(api_id)
+        if archive_dir:
+            archive_field(archive_dir, api_id, field_data)
+        return field_data
+
+    processed, failed, entries = 0, [], 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(load, t): t for t in pending}
+        for future in as_completed(futures):
+            tournament = futures[future]
+            try:
+                field_data = future.result()
+                entries += bulk_insert_tournament_entries(
+                    session, tournament["id"], tournament["year"], field_data, golfers
+                )
+                session.commit()
+            except Exception as e:
+                logger.error(f"Error backfilling tournament {tournament['id']}: {str(e)}")
+                session.rollback()
+                failed.append(tournament["id"])
+                continue
+
+            processed += 1
+            completed.add(tournament["id"])
+            save_checkpoint(checkpoint_path, completed)
+
+    elapsed = time.monotonic() - started
+    rate = processed / elapsed * 60 if elapsed > 0 else 0.0
+    logger.info(
+        f"Backfill complete: {processed} tournaments, {entries} entries, "
+        f"{len(failed)} failed in {elapsed:.1f}s ({rate:.1f} tournaments/min)"
+    )
+    return {
+        "processed": processed,
+        "skipped": len(tournaments) - len(pending),
+        "failed": failed,
+        "entries": entries,
+        "elapsed_seconds": elapsed,
+        "tournaments_per_minute": rate
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Backfill tournament fields for past seasons")
+    parser.add_argument("--start-year", type=int, required=True)
+    parser.add_argument("--end-year", type=int, required=True)
+    parser.add_argument("--checkpoint", default="backfill_checkpoint.json")
+    parser.add_argument("--archive-dir")
+    parser.add_argument("--replay", action="store_true")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    # Imported here so the module can be used without Cloud SQL credentials
+    from google.cloud import firestore
+    from src.utils.db.db_connector import get_db_connection
+    from src.utils.rate_limit.rate_limiter import use_firestore_quotas
+
+    # Count requests against the same daily quota as the deployed functions
+    use_firestore_quotas(firestore.Client())
+
+    with Session(get_db_connection()) as session:
+        summary = backfill_tournament_fields(
+            session,
+            args.start_year,
+            args.end_year,
+            checkpoint_path=args.checkpoint,
+            archive_dir=args.archive_dir,
+            replay=args.replay,
+            max_workers=args.max_workers
+        )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,14 +5,17 @@ Handles SQL database operations for tournament fields using SQLAlchemy ORM.
 Ports functionality from golf-fantasy-backend.
 """
 
-from sqlalchemy import and_
-from datetime import datetime
-from typing import Dict, Any, Optional
+from sqlalchemy import and_, insert
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Set
 import logging
 from src.models import Tournament, TournamentGolfer, Golfer
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany batch for bulk inserts
+BULK_INSERT_CHUNK_SIZE = 1000
+
 def get_upcoming_tournament(session) -> Optional[Dict[str, Any]]:
     """
     Get the next upcoming tournament from SQL database.
@@ -40,6 +43,7 @@ def get_upcoming_tournament(session) -> Optional[Dict[str, Any]]:
         return {
             "id": tournament.id,
             "sportcontent_api_id": tournament.sportcontent_api_id,
+            "tour_id": tournament.sportcontent_api_tour_id,
             "tournament_name": tournament.tournament_name
         }
             
@@ -47,10 +51,195 @@ def get_upcoming_tournament(session) -> Optional[Dict[str, Any]]:
         logger.error(f"Error fetching upcoming tournament: {str(e)}")
         return None
 
+def get_upcoming_tournaments(session, days_ahead: int = 7) -> List[Dict[str, Any]]:
+    """
+    Get the next tournament for each tour starting within the next few days.
+
+    Only the earliest tournament per tour is returned, and, as in
+    get_upcoming_tournament, only tournaments that have not started yet, so
+    two events on one tour never race on the tour's current field pointer.
+
+    Args:
+        session: SQLAlchemy session
+        days_ahead: Size of the look-ahead window in days
+
+    Returns:
+        List of tournament info dicts ordered by start date
+    """
+    logger.info(f"Fetching tournaments starting in the next {days_ahead} days")
+    today = datetime.now().date()
+
+    tournaments = (
+        session.query(Tournament)
+        .filter(Tournament.start_date > today)
+        .filter(Tournament.start_date <= today + timedelta(days=days_ahead))
+        .filter(Tournament.sportcontent_api_id.isnot(None))
+        .order_by(Tournament.start_date, Tournament.id)
+        .all()
+    )
+
+    upcoming = {}
+    for t in tournaments:
+        upcoming.setdefault(t.sportcontent_api_tour_id, {
+            "id": t.id,
+            "sportcontent_api_id": t.sportcontent_api_id,
+            "tour_id": t.sportcontent_api_tour_id,
+            "tournament_name": t.tournament_name
+        })
+    return list(upcoming.values())
+
+def get_entry_list(field_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract the entry list from a SportContent API payload.
+
+    Args:
+        field_data: Field data from SportContent API
+
+    Returns:
+        List of player dicts (empty if the payload has no entries)
+    """
+    results = field_data.get("results") or {}
+    return results.get("entry_list") or field_data.get("field") or []
+
+def get_golfer_id_map(session) -> Dict[str, str]:
+    """
+    Map SportContent player IDs to golfer IDs.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Dict of str(sportcontent_api_id) -> golfer.id
+    """
+    rows = (
+        session.query(Golfer.sportcontent_api_id, Golfer.id)
+        .filter(Golfer.sportcontent_api_id.isnot(None))
+        .all()
+    )
+    return {str(api_id): golfer_id for api_id, golfer_id in rows}
+
+def bulk_insert_tournament_entries(
+    session,
+    tournament_id: int,
+    year: int,
+    field_data: Dict[str, Any],
+    golfers: Dict[str, str]
+) -> int:
+    """
+    Replace the most recent entries for a tournament with bulk inserts.
+
+    Entries are streamed from the payload into fixed-size executemany
+    batches, so no ORM objects are created and at most one chunk of row
+    dicts is held at a time. Does not commit; the caller owns the transaction.
+
+    Args:
+        session: SQLAlchemy session
+        tournament_id: Tournament ID in our database
+        year: Tournament year
+        field_data: Field data from SportContent API
+        golfers: Mapping from get_golfer_id_map
+
+    Returns:
+        Number of entries inserted
+    """
+    (session.query(TournamentGolfer)
+     .filter(and_(
+         TournamentGolfer.tournament_id == tournament_id,
+         TournamentGolfer.year == year
+     ))
+     .update({"is_most_recent": False}, synchronize_session=False))
+
+    inserted, rows = 0, []
+    for player in get_entry_list(field_data):
+        player_id = str(player.get("player_id"))
+        if player_id not in golfers:
+            logger.warning(f"Golfer with SportContent ID {player_id} not found in database")
+            continue
+        rows.append({
+            "tournament_id": tournament_id,
+            "golfer_id": golfers[player_id],
+            "year": year,
+            "is_most_recent": True,
+            "is_active": True
+        })
+        if len(rows) >= BULK_INSERT_CHUNK_SIZE:
+            session.execute(insert(TournamentGolfer), rows)
+            inserted, rows = inserted + len(rows), []
+
+    if rows:
+        session.execute(insert(TournamentGolfer), rows)
+    return inserted + len(rows)
+
+def get_field_golfer_ids(session, tournament_id: int) -> Set[str]:
+    """
+    Get the golfer IDs in a tournament's most recent field.
+
+    Args:
+        session: SQLAlchemy session
+        tournament_id: Tournament ID in our database
+
+    Returns:
+        Set of golfer IDs
+    """
+    rows = (
+        session.query(TournamentGolfer.golfer_id)
+        .filter(and_(
+            TournamentGolfer.tournament_id == tournament_id,
+            TournamentGolfer.is_most_recent.is_(True)
+        ))
+        .all()
+    )
+    return {golfer_id for (golfer_id,) in rows}
+
+def get_current_field(
+    session,
+    tournament_id: int,
+    rankings: Optional[Dict[int, int]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get the most recent field for a tournament joined to golfer details.
+
+    Args:
+        session: SQLAlchemy session
+        tournament_id: Tournament ID in our database
+        rankings: Optional mapping of DataGolf ID -> rank
+
+    Returns:
+        List of player dicts sorted by rank, then name
+    """
+    rankings = rankings or {}
+    rows = (
+        session.query(
+            Golfer.id, Golfer.full_name, Golfer.photo_url, Golfer.datagolf_id,
+            TournamentGolfer.is_active, TournamentGolfer.is_alternate, TournamentGolfer.is_injured
+        )
+        .join(Golfer, TournamentGolfer.golfer_id == Golfer.id)
+        .filter(and_(
+            TournamentGolfer.tournament_id == tournament_id,
+            TournamentGolfer.is_most_recent.is_(True)
+        ))
+        .all()
+    )
+    players = [
+        {
+            "golfer_id": row.id,
+            "display_name": row.full_name,
+            "photo_url": row.photo_url,
+            "is_active": row.is_active,
+            "is_alternate": row.is_alternate,
+            "is_injured": row.is_injured,
+            "rank": rankings.get(row.datagolf_id)
+        }
+        for row in rows
+    ]
+    players.sort(key=lambda p: (p["rank"] is None, p["rank"] or 0, p["display_name"]))
+    return players
+
 def update_tournament_entries(
     session,
     tournament_id: int,
-    field_data: Dict[str, Any]
+    field_data: Dict[str, Any],
+    low_memory: bool = False
 ) -> Optional[bool]:
     """
     Update tournament entries in SQL database.
@@ -59,6 +248,8 @@ def update_tournament_entries(
         session: SQLAlchemy session
         tournament_id: Tournament ID in our database
         field_data: Field data from SportContent API
+        low_memory: Write with chunked bulk inserts and clear the session's
+            identity map afterwards instead of adding ORM objects
         
     Returns:
         True if successful, None if failed
@@ -67,6 +258,14 @@ def update_tournament_entries(
     year = str(datetime.now().year)
     
     try:
+        if low_memory:
+            bulk_insert_tournament_entries(
+                session, tournament_id, year, field_data, get_golfer_id_map(session)
+            )
+            session.commit()
+            session.expunge_all()
+            return True
+
         # Mark existing entries as not most recent
         (session.query(TournamentGolfer)
          .filter(and_(
@@ -76,15 +275,10 @@ def update_tournament_entries(
          .update({"is_most_recent": False}))
         
         # Get golfer mapping
-        golfers = {
-            g.sportcontent_api_id: g.id 
-            for g in session.query(Golfer)
-            .filter(Golfer.sportcontent_api_id.isnot(None))
-            .all()
-        }
+        golfers = get_golfer_id_map(session)
         
         # Add new entries
-        for player in field_data.get("field", []):
+        for player in get_entry_list(field_data):
             player_id = str(player.get("player_id"))
             if player_id in golfers:
                 entry = TournamentGolfer(
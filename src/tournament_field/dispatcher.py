@@ -0,0 +1,112 @@
+"""
+Tournament Field Dispatcher
+
+Fans field updates out to one task per tournament so the work spreads
+across worker instances instead of running serially in one invocation.
+
+Queues:
+- PubSubTaskQueue publishes tasks to a Pub/Sub topic (production). Worker
+  concurrency is bounded by the worker function's max instances and
+  failed tasks are redelivered by the subscription's retry policy.
+- LocalTaskQueue runs tasks in-process with a bounded thread pool and
+  per-task retries (tests and local runs).
+"""
+
+from google.cloud import pubsub_v1
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import json
+import logging
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def make_task(tournament: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the task payload for one tournament"""
+    return {
+        "id": tournament["id"],
+        "sportcontent_api_id": tournament["sportcontent_api_id"],
+        "tour_id": tournament.get("tour_id"),
+        "tournament_name": tournament["tournament_name"]
+    }
+
+
+def decode_pubsub_task(cloud_event) -> Dict[str, Any]:
+    """Extract the task payload from a Pub/Sub CloudEvent"""
+    data = cloud_event.data["message"]["data"]
+    return json.loads(base64.b64decode(data))
+
+
+class PubSubTaskQueue:
+    """Publishes tasks as JSON messages to a Pub/Sub topic"""
+
+    def __init__(self, topic_path: str, publisher=None):
+        self.topic_path = topic_path
+        self.publisher = publisher or pubsub_v1.PublisherClient()
+        self._futures = []
+
+    def enqueue(self, task: Dict[str, Any]) -> None:
+        self._futures.append(
+            self.publisher.publish(self.topic_path, json.dumps(task).encode("utf-8"))
+        )
+
+    def join(self) -> List[str]:
+        """Wait for all publishes to be acknowledged, returning message IDs"""
+        futures, self._futures = self._futures, []
+        return [future.result() for future in futures]
+
+
+class LocalTaskQueue:
+    """Runs tasks in-process with bounded concurrency and per-task retries"""
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Any],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ):
+        self.handler = handler
+        self.max_attempts = max_attempts
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+
+    def _run(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return {"task": task, "status": "success", "result": self.handler(task), "attempts": attempt}
+            except Exception as e:
+                logger.warning(f"Task for tournament {task.get('id')} failed (attempt {attempt}): {str(e)}")
+                error = str(e)
+        return {"task": task, "status": "error", "error": error, "attempts": self.max_attempts}
+
+    def enqueue(self, task: Dict[str, Any]) -> None:
+        self._futures.append(self._pool.submit(self._run, task))
+
+    def join(self) -> List[Dict[str, Any]]:
+        """Wait for all tasks to finish, returning one result per task"""
+        futures, self._futures = self._futures, []
+        return [future.result() for future in futures]
+
+
+def dispatch_tournament_field_updates(tournaments: List[Dict[str, Any]], queue) -> int:
+    """
+    Enqueue one field update task per tournament.
+
+    Call queue.join() afterwards to wait for delivery (or completion,
+    for a LocalTaskQueue).
+
+    Args:
+        tournaments: Tournament info dicts from get_upcoming_tournaments
+        queue: PubSubTaskQueue or LocalTaskQueue
+
+    Returns:
+        Number of tasks enqueued
+    """
+    for tournament in tournaments:
+        logger.info(f"Dispatching field update for tournament {tournament['id']}")
+        queue.enqueue(make_task(tournament))
+    return len(tournaments)
@@ -0,0 +1,266 @@
+"""
+Field Change Notifications
+
+Turns entry list updates into notifications for affected users:
+1. Diffs the previous and new field into addition/withdrawal events
+2. Coalesces events in a per-tournament buffer until the window elapses
+   (an addition and a withdrawal of the same golfer cancel out)
+3. Resolves affected users through the golfer -> pickers index
+4. Publishes notifications in batches for the push sender
+
+Buffers are flushed by the next field update after the window closes, or
+by the scheduled flusher (FieldChangeNotifier.flush_due), so notifications
+go out within the window even if no further update runs.
+
+Cost scales with the number of changed golfers, not users x runs.
+"""
+
+from google.cloud import firestore
+from datetime import datetime, timedelta, timezone
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+ADDITION = "addition"
+WITHDRAWAL = "withdrawal"
+
+BUFFER_COLLECTION = "field_change_buffers"
+PICKER_INDEX_COLLECTION = "golfer_pickers"
+
+DEFAULT_WINDOW_SECONDS = 600
+DEFAULT_BATCH_SIZE = 500
+
+
+def diff_field(previous: Set[str], current: Set[str]) -> Dict[str, str]:
+    """Map each changed golfer ID to its event type"""
+    events = {golfer_id: ADDITION for golfer_id in current - previous}
+    events.update({golfer_id: WITHDRAWAL for golfer_id in previous - current})
+    return events
+
+
+def merge_pending(
+    state: Dict[str, Any],
+    events: Dict[str, str],
+    now: datetime,
+    window_seconds: float
+) -> Dict[str, Any]:
+    """
+    Coalesce new events into a buffer state and decide whether to flush.
+
+    Args:
+        state: Buffer state with "pending" (golfer ID -> event type), "window_started"
+            and "flush_at" (when the window closes)
+        events: New events from diff_field
+        now: Current UTC time
+        window_seconds: How long to hold events after the first one arrives
+
+    Returns:
+        Dict with the new buffer "state" and the "flushed" events (empty if still waiting)
+    """
+    pending = dict(state.get("pending") or {})
+    window_started = state.get("window_started")
+
+    for golfer_id, event_type in events.items():
+        if pending.get(golfer_id, event_type) != event_type:
+            # Opposite events within one window cancel out
+            del pending[golfer_id]
+        else:
+            pending[golfer_id] = event_type
+
+    empty = {"pending": {}, "window_started": None, "flush_at": None}
+    if not pending:
+        return {"state": empty, "flushed": {}}
+    if window_started is None:
+        window_started = now
+    if (now - window_started).total_seconds() >= window_seconds:
+        return {"state": empty, "flushed": pending}
+    return {
+        "state": {
+            "pending": pending,
+            "window_started": window_started,
+            "flush_at": window_started + timedelta(seconds=window_seconds)
+        },
+        "flushed": {}
+    }
+
+
+class InMemoryChangeBuffer:
+    """Per-instance change buffer (tests and local runs)"""
+
+    def __init__(self, window_seconds: float = DEFAULT_WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+        self._states: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def add_and_flush(self, tournament_id: int, events: Dict[str, str], now: datetime) -> Dict[str, str]:
+        with self._lock:
+            result = merge_pending(self._states.get(tournament_id, {}), events, now, self.window_seconds)
+            self._states[tournament_id] = result["state"]
+            return result["flushed"]
+
+    def due_tournaments(self, now: datetime) -> List[int]:
+        with self._lock:
+            return [
+                tournament_id for tournament_id, state in self._states.items()
+                if state.get("flush_at") and state["flush_at"] <= now
+            ]
+
+
+class FirestoreChangeBuffer:
+    """Change buffer shared across instances, stored in field_change_buffers/{tournament_id}"""
+
+    def __init__(self, db: firestore.Client, window_seconds: float = DEFAULT_WINDOW_SECONDS):
+        self.db = db
+        self.window_seconds = window_seconds
+
+    def add_and_flush(self, tournament_id: int, events: Dict[str, str], now: datetime) -> Dict[str, str]:
+        doc_ref = self.db.collection(BUFFER_COLLECTION).document(str(tournament_id))
+        window_seconds = self.window_seconds
+
+        @firestore.transactional
+        def update(transaction) -> Dict[str, str]:
+            snapshot = doc_ref.get(transaction=transaction)
+            state = snapshot.to_dict() if snapshot.exists else {}
+            result = merge_pending(state, events, now, window_seconds)
+            transaction.set(doc_ref, result["state"])
+            return result["flushed"]
+
+        return update(self.db.transaction())
+
+    def due_tournaments(self, now: datetime) -> List[int]:
+        query = self.db.collection(BUFFER_COLLECTION).where(
+            filter=firestore.FieldFilter("flush_at", "<=", now)
+        )
+        return [int(snapshot.id) for snapshot in query.stream()]
+
+
+class FirestorePickerIndex:
+    """
+    Golfer -> pickers index in golfer_pickers/{tournament_id}_{golfer_id}.
+
+    Maintained by the pick writer with add_picker/remove_picker; read here
+    only for golfers whose status changed.
+    """
+
+    def __init__(self, db: firestore.Client):
+        self.db = db
+
+    def _doc(self, tournament_id: int, golfer_id: str):
+        return self.db.collection(PICKER_INDEX_COLLECTION).document(f"{tournament_id}_{golfer_id}")
+
+    def add_picker(self, tournament_id: int, golfer_id: str, user_id: str) -> None:
+        self._doc(tournament_id, golfer_id).set(
+            {"user_ids": firestore.ArrayUnion([user_id])}, merge=True
+        )
+
+    def remove_picker(self, tournament_id: int, golfer_id: str, user_id: str) -> None:
+        self._doc(tournament_id, golfer_id).set(
+            {"user_ids": firestore.ArrayRemove([user_id])}, merge=True
+        )
+
+    def get_pickers(self, tournament_id: int, golfer_ids: Iterable[str]) -> Dict[str, List[str]]:
+        refs = [self._doc(tournament_id, golfer_id) for golfer_id in golfer_ids]
+        pickers = {}
+        for snapshot in self.db.get_all(refs):
+            if snapshot.exists:
+                golfer_id = snapshot.id.split("_", 1)[1]
+                pickers[golfer_id] = (snapshot.to_dict() or {}).get("user_ids", [])
+        return pickers
+
+
+def build_notification_batches(
+    tournament_id: int,
+    events: Dict[str, str],
+    pickers: Dict[str, List[str]],
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> List[Dict[str, Any]]:
+    """Group one notification per (user, changed golfer) into batches"""
+    notifications = [
+        {"user_id": user_id, "golfer_id": golfer_id, "type": event_type}
+        for golfer_id, event_type in sorted(events.items())
+        for user_id in pickers.get(golfer_id, [])
+    ]
+    return [
+        {"tournament_id": tournament_id, "notifications": notifications[i:i + batch_size]}
+        for i in range(0, len(notifications), batch_size)
+    ]
+
+
+class FieldChangeNotifier:
+    """Runs the change-event stage for one field update"""
+
+    def __init__(self, buffer, picker_index, queue, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.buffer = buffer
+        self.picker_index = picker_index
+        self.queue = queue
+        self.batch_size = batch_size
+
+    def process(
+        self,
+        tournament_id: int,
+        previous: Set[str],
+        current: Set[str],
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        Emit change events for a field update and notify affected users.
+
+        The first field stored for a tournament has nothing to compare
+        against, so no events are emitted for it rather than announcing every
+        golfer as an addition.
+
+        Returns:
+            Summary counts of events, flushed events and notification batches
+        """
+        if not previous:
+            logger.info(f"No previous field for tournament {tournament_id}, skipping change events")
+            return {"events": 0, "flushed": 0, "batches": 0}
+
+        now = now or datetime.now(timezone.utc)
+        events = diff_field(previous, current)
+        flushed = self.buffer.add_and_flush(tournament_id, events, now)
+        batches = self._publish(tournament_id, flushed)
+
+        logger.info(
+            f"Field changes for tournament {tournament_id}: {len(events)} new, "
+            f"{len(flushed)} flushed, {len(batches)} notification batches"
+        )
+        return {"events": len(events), "flushed": len(flushed), "batches": len(batches)}
+
+    def flush_due(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Send buffered changes whose window has closed.
+
+        Run on a schedule so notifications do not wait for the next field
+        update (or get stranded after the last update before lock).
+
+        Returns:
+            Summary counts of flushed tournaments, events and notification batches
+        """
+        now = now or datetime.now(timezone.utc)
+        tournaments, flushed_count, batch_count = 0, 0, 0
+        for tournament_id in self.buffer.due_tournaments(now):
+            flushed = self.buffer.add_and_flush(tournament_id, {}, now)
+            if flushed:
+                tournaments += 1
+                flushed_count += len(flushed)
+                batch_count += len(self._publish(tournament_id, flushed))
+
+        logger.info(
+            f"Flushed field changes for {tournaments} tournaments: "
+            f"{flushed_count} events, {batch_count} notification batches"
+        )
+        return {"tournaments": tournaments, "flushed": flushed_count, "batches": batch_count}
+
+    def _publish(self, tournament_id: int, flushed: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Resolve affected users for flushed events and publish the notification batches"""
+        if not flushed:
+            return []
+        pickers = self.picker_index.get_pickers(tournament_id, flushed.keys())
+        batches = build_notification_batches(tournament_id, flushed, pickers, self.batch_size)
+        for batch in batches:
+            self.queue.enqueue(batch)
+        self.queue.join()
+        return batches
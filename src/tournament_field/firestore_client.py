@@ -7,11 +7,19 @@ Maintains historical records of tournament fields with timestamps.
 
 from google.cloud import firestore
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import hashlib
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+CURRENT_FIELD_COLLECTION = "current_fields"
+CURRENT_FIELD_POINTER = "current"
+
+# SportContent tour ID used when a tournament has none (matches the model default)
+DEFAULT_TOUR_ID = 2
+
 def store_tournament_field(
     db: firestore.Client,
     tournament_id: str,
@@ -34,6 +42,7 @@ def store_tournament_field(
         doc_ref = db.collection("tournament_fields").document(tournament_id)
         doc_ref.set({
             "field": field_data,
+            "content_hash": get_field_version(field_data),
             "last_updated": datetime.now(timezone.utc),
             "data_source": "sportcontent_api"
         })
@@ -46,13 +55,14 @@ def store_tournament_field(
     
     
 
-def get_tournament_field(db: firestore.Client,tournament_id: str) -> Optional [Dict[str, Any]]:
+def get_tournament_field(db: firestore.Client,tournament_id: str, raise_errors: bool = False) -> Optional [Dict[str, Any]]:
     """
-    Retrieve tournament field data from Firestore.  Not currently used, but could be useful in the future.
+    Retrieve tournament field data from Firestore.  Used by the cached field read API.
     
     Args:
         db: Initialized Firestore client
         tournament_id: Tournament identifier
+        raise_errors: Re-raise Firestore errors instead of returning None
         
     Returns:
         Tournament field data or None if not found
@@ -69,4 +79,121 @@ def get_tournament_field(db: firestore.Client,tournament_id: str) -> Optional [D
         
     except Exception as e:
         logger.error(f"Error retrieving tournament field from Firestore: {str(e)}")
+        if raise_errors:
+            raise
+        return None
+
+
+def get_field_version(data: Any) -> str:
+    """
+    Content hash of a stored or published field.
+
+    Identical fields always produce the same version, so clients only
+    refetch when something actually changed.
+    """
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_current_field_pointer(tour_id: Optional[int]) -> str:
+    """Document ID of the current field pointer for a tour"""
+    return f"{CURRENT_FIELD_POINTER}_{tour_id or DEFAULT_TOUR_ID}"
+
+
+def publish_current_field(
+    db: firestore.Client,
+    tournament: Dict[str, Any],
+    players: List[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    Publish the denormalized current field for app reads.
+
+    Writes the full field to current_fields/{tournament_id} and a small
+    pointer document per tour (current_fields/current_{tour_id}) holding
+    only the tournament and version, so clients can check for staleness
+    without reading the field. Workers for tournaments on different tours
+    run concurrently, so each tour keeps its own pointer.
+
+    Args:
+        db: Initialized Firestore client
+        tournament: Tournament info dict (id, tour_id, tournament_name)
+        players: Player dicts from get_current_field
+
+    Returns:
+        Published version if successful, None if failed
+    """
+    tournament_id = str(tournament["id"])
+    logger.info(f"Publishing current field for tournament {tournament_id}")
+
+    try:
+        version = get_field_version(players)
+        now = datetime.now(timezone.utc)
+        collection = db.collection(CURRENT_FIELD_COLLECTION)
+
+        batch = db.batch()
+        batch.set(collection.document(tournament_id), {
+            "tournament_id": tournament["id"],
+            "tournament_name": tournament.get("tournament_name"),
+            "players": players,
+            "player_count": len(players),
+            "version": version,
+            "last_updated": now
+        })
+        batch.set(collection.document(get_current_field_pointer(tournament.get("tour_id"))), {
+            "tournament_id": tournament["id"],
+            "version": version,
+            "last_updated": now
+        })
+        batch.commit()
+        return version
+
+    except Exception as e:
+        logger.error(f"Error publishing current field to Firestore: {str(e)}")
+        return None
+
+
+def get_published_field_version(db: firestore.Client, tournament_id: str) -> Optional[str]:
+    """
+    Read only the version of a published current field.
+
+    Args:
+        db: Initialized Firestore client
+        tournament_id: Tournament ID in our database
+
+    Returns:
+        Published version or None if not found
+    """
+    try:
+        doc = db.collection(CURRENT_FIELD_COLLECTION).document(tournament_id).get(field_paths=["version"])
+        if doc.exists:
+            return doc.to_dict().get("version")
+        return None
+
+    except Exception as e:
+        logger.error(f"Error retrieving current field version from Firestore: {str(e)}")
+        return None
+
+
+def get_tournament_field_hash(db: firestore.Client, tournament_id: str, raise_errors: bool = False) -> Optional[str]:
+    """
+    Read only the content hash of a stored tournament field.
+
+    Args:
+        db: Initialized Firestore client
+        tournament_id: Tournament identifier
+        raise_errors: Re-raise Firestore errors instead of returning None
+
+    Returns:
+        Content hash or None if not found
+    """
+    try:
+        doc = db.collection("tournament_fields").document(tournament_id).get(field_paths=["content_hash"])
+        if doc.exists:
+            return doc.to_dict().get("content_hash")
+        return None
+
+    except Exception as e:
+        logger.error(f"Error retrieving tournament field hash from Firestore: {str(e)}")
+        if raise_errors:
+            raise
         return None
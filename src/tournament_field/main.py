@@ -6,74 +6,162 @@ Cloud Function that coordinates updating tournament field data:
 2. Gets field data from SportContent API
 3. Stores field data in Firestore
 4. Updates SQL database entries
+5. Publishes the denormalized current field for app reads
+
+Also provides a dispatcher that enqueues one task per upcoming tournament,
+the worker that runs the same stages for a single task, and a scheduled
+flusher for field change notifications whose coalescing window has closed.
 """
 
 import functions_framework
 from google.cloud import firestore
-from datetime import datetime, timezone
+from sqlalchemy.orm import Session
 import logging
-from typing import Dict, Any, Tuple
-from utils.db import get_db_connection
-from .api_client import fetch_tournament_field
-from .firestore_client import store_tournament_field
-from .db_client import get_upcoming_tournament, update_tournament_entries
+from typing import Dict, Any, Optional, Tuple
+from src.utils.config.config import get_config
+from src.utils.db.db_connector import get_db_connection
+from src.utils.rate_limit.rate_limiter import use_firestore_quotas
+from src.utils.profiling.memory_profiler import MemoryProfiler
+from .db_client import get_upcoming_tournament, get_upcoming_tournaments
+from .dispatcher import PubSubTaskQueue, dispatch_tournament_field_updates, decode_pubsub_task
+from .field_changes import FieldChangeNotifier, FirestoreChangeBuffer, FirestorePickerIndex, DEFAULT_WINDOW_SECONDS
+from .pipeline import run_tournament_field_update
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fail fast on cold start if required configuration is missing
+config = get_config()
+config.validate("db", "sportcontent")
+
+# Pipeline options for the smallest memory tier
+LOW_MEMORY_MODE = config.get_bool("LOW_MEMORY_MODE")
+PROFILE_MEMORY = config.get_bool("PROFILE_MEMORY")
+
+def get_field_change_notifier(db: firestore.Client) -> Optional[FieldChangeNotifier]:
+    """Build the change notifier when FIELD_CHANGE_TOPIC is configured"""
+    topic = config.get("FIELD_CHANGE_TOPIC")
+    if not topic:
+        return None
+    return FieldChangeNotifier(
+        FirestoreChangeBuffer(db, config.get_int("FIELD_CHANGE_WINDOW_SECONDS", DEFAULT_WINDOW_SECONDS)),
+        FirestorePickerIndex(db),
+        PubSubTaskQueue(topic)
+    )
+
+def run_pipeline(db: firestore.Client, session, tournament: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """Run the field update stages with the configured memory and notification options"""
+    with MemoryProfiler(enabled=PROFILE_MEMORY) as profiler:
+        return run_tournament_field_update(
+            db, session, tournament, low_memory=LOW_MEMORY_MODE, profiler=profiler,
+            notifier=get_field_change_notifier(db)
+        )
+
 def update_tournament_field_data() -> Tuple[Dict[str, Any], int]:
     """
     Main controller function for updating tournament field data.
-    
+
     Returns:
         Tuple of (response_dict, status_code)
     """
     try:
         logger.info("Starting tournament field update")
-        
+
         # Initialize clients
         db = firestore.Client()
+        use_firestore_quotas(db)
         db_engine = get_db_connection()
-        
-        # Get active tournament
-        tournament = get_upcoming_tournament(db_engine)
-        if not tournament:
+
+        with Session(db_engine) as session:
+            # Get active tournament
+            tournament = get_upcoming_tournament(session)
+            if not tournament:
+                return {
+                    'status': 'error',
+                    'message': 'No upcoming tournament found'
+                }, 404
+
+            return run_pipeline(db, session, tournament)
+
+    except Exception as e:
+        logger.error(f"Error updating tournament field: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+def dispatch_tournament_field_data(days_ahead: int = 7) -> Tuple[Dict[str, Any], int]:
+    """
+    Enqueue one field update task per tournament starting in the next few days.
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    try:
+        with Session(get_db_connection()) as session:
+            tournaments = get_upcoming_tournaments(session, days_ahead)
+
+        if not tournaments:
             return {
                 'status': 'error',
-                'message': 'No upcoming tournament found'
+                'message': 'No upcoming tournaments found'
             }, 404
-            
-        # Fetch field data from SportContent API
-        field_data = fetch_tournament_field(tournament["sportcontent_api_id"])
-        if not field_data:
-            return {
-                'status': 'error',
-                'message': 'Failed to fetch tournament field data'
-            }, 500
-        
-        # Store in Firestore
-        if not store_tournament_field(db, tournament["sportcontent_api_id"], field_data):
-            return {
-                'status': 'error',
-                'message': 'Failed to store tournament field in Firestore'
-            }, 500
-        
-        # Update SQL database
-        if not update_tournament_entries(db_engine, tournament["id"], field_data):
+
+        queue = PubSubTaskQueue(config.get("TOURNAMENT_FIELD_TOPIC"))
+        count = dispatch_tournament_field_updates(tournaments, queue)
+        queue.join()
+
+        return {
+            'status': 'success',
+            'message': f'Dispatched field updates for {count} tournaments'
+        }, 200
+
+    except Exception as e:
+        logger.error(f"Error dispatching tournament field updates: {str(e)}")
+        return {
+            'status': 'error',
+            'message': str(e)
+        }, 500
+
+def process_tournament_field_task(task: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+    """
+    Worker controller: run the field update stages for one dispatched tournament.
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    logger.info(f"Processing field update task for tournament {task['id']}")
+    db = firestore.Client()
+    use_firestore_quotas(db)
+
+    with Session(get_db_connection()) as session:
+        return run_pipeline(db, session, task)
+
+def flush_field_change_data() -> Tuple[Dict[str, Any], int]:
+    """
+    Send buffered field change notifications whose window has closed.
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    try:
+        notifier = get_field_change_notifier(firestore.Client())
+        if not notifier:
             return {
                 'status': 'error',
-                'message': 'Failed to update tournament entries in database'
+                'message': 'FIELD_CHANGE_TOPIC is not configured'
             }, 500
-        
+
+        summary = notifier.flush_due()
         return {
             'status': 'success',
-            'message': f'Tournament field updated for {tournament["tournament_name"]}',
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'message': f'Flushed field changes for {summary["tournaments"]} tournaments',
+            **summary
         }, 200
 
     except Exception as e:
-        logger.error(f"Error updating tournament field: {str(e)}")
+        logger.error(f"Error flushing field changes: {str(e)}")
         return {
             'status': 'error',
             'message': str(e)
@@ -83,4 +171,23 @@ def update_tournament_field_data() -> Tuple[Dict[str, Any], int]:
 def update_tournament_field(request) -> Tuple[Dict[str, Any], int]:
     """Cloud Function entry point for updating tournament field data"""
     response, status_code = update_tournament_field_data()
-    return response, status_code
\ No newline at end of file
+    return response, status_code
+
+@functions_framework.http
+def dispatch_tournament_fields(request) -> Tuple[Dict[str, Any], int]:
+    """Cloud Function entry point for fanning out tournament field updates"""
+    response, status_code = dispatch_tournament_field_data()
+    return response, status_code
+
+@functions_framework.cloud_event
+def process_tournament_field(cloud_event) -> None:
+    """Pub/Sub-triggered worker entry point; raising makes Pub/Sub redeliver the task"""
+    response, status_code = process_tournament_field_task(decode_pubsub_task(cloud_event))
+    if status_code != 200:
+        raise RuntimeError(response['message'])
+
+@functions_framework.http
+def flush_field_changes(request) -> Tuple[Dict[str, Any], int]:
+    """Cloud Function entry point for the scheduled field change flusher"""
+    response, status_code = flush_field_change_data()
+    return response, status_code
@@ -0,0 +1,121 @@
+"""
+Tournament Field Pipeline
+
+Runs the field update stages for a single tournament:
+1. Gets field data from SportContent API
+2. Stores field data in Firestore
+3. Updates SQL database entries
+4. Publishes the denormalized current field for app reads
+5. Emits field change events and notifies affected users
+
+Shared by the update_tournament_field function and the per-tournament
+dispatcher workers.
+"""
+
+from google.cloud import firestore
+from datetime import datetime, timezone
+import logging
+from typing import Dict, Any, Optional, Tuple
+from src.utils.datagolf.datagolf_client import fetch_owgr_ranks
+from src.utils.profiling.memory_profiler import MemoryProfiler
+from .api_client import fetch_tournament_field
+from .firestore_client import store_tournament_field, publish_current_field
+from .db_client import update_tournament_entries, get_current_field, get_field_golfer_ids
+from .field_changes import FieldChangeNotifier
+
+logger = logging.getLogger(__name__)
+
+def run_tournament_field_update(
+    db: firestore.Client,
+    session,
+    tournament: Dict[str, Any],
+    low_memory: bool = False,
+    profiler: Optional[MemoryProfiler] = None,
+    notifier: Optional[FieldChangeNotifier] = None
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Update the field for one tournament.
+
+    Args:
+        db: Initialized Firestore client
+        session: SQLAlchemy session
+        tournament: Tournament info dict (id, sportcontent_api_id, tournament_name)
+        low_memory: Bulk-write entries without ORM objects
+        profiler: Records peak memory per stage when enabled
+        notifier: Emits change events for withdrawals/additions when provided
+
+    Returns:
+        Tuple of (response_dict, status_code)
+    """
+    profiler = profiler or MemoryProfiler(enabled=False)
+
+    # Fetch field data from SportContent API
+    with profiler.stage("fetch"):
+        field_data = fetch_tournament_field(tournament["sportcontent_api_id"])
+    if not field_data:
+        return {
+            'status': 'error',
+            'message': 'Failed to fetch tournament field data'
+        }, 500
+
+    # Store in Firestore
+    with profiler.stage("store_firestore"):
+        stored = store_tournament_field(db, str(tournament["sportcontent_api_id"]), field_data)
+    if not stored:
+        return {
+            'status': 'error',
+            'message': 'Failed to store tournament field in Firestore'
+        }, 500
+
+    # Capture the field before the update for change notifications; never fails the field update
+    previous_field = None
+    if notifier:
+        try:
+            previous_field = get_field_golfer_ids(session, tournament["id"])
+        except Exception as e:
+            logger.error(f"Error reading previous field, skipping change notifications: {str(e)}")
+            session.rollback()
+
+    # Update SQL database
+    with profiler.stage("update_entries"):
+        updated = update_tournament_entries(session, tournament["id"], field_data, low_memory=low_memory)
+    # The raw payload is not needed past this point
+    field_data = None
+    if not updated:
+        return {
+            'status': 'error',
+            'message': 'Failed to update tournament entries in database'
+        }, 500
+
+    # Publish read-optimized current field
+    with profiler.stage("publish_current_field"):
+        try:
+            rankings = fetch_owgr_ranks()
+        except Exception as e:
+            logger.warning(f"Publishing field without rankings: {str(e)}")
+            rankings = {}
+        players = get_current_field(session, tournament["id"], rankings)
+        version = publish_current_field(db, tournament, players)
+    if not version:
+        return {
+            'status': 'error',
+            'message': 'Failed to publish current field'
+        }, 500
+
+    # Notify users whose picks were affected; never fails the field update
+    if notifier and previous_field is not None:
+        with profiler.stage("notify_field_changes"):
+            try:
+                notifier.process(tournament["id"], previous_field, {p["golfer_id"] for p in players})
+            except Exception as e:
+                logger.error(f"Error notifying field changes: {str(e)}")
+
+    response = {
+        'status': 'success',
+        'message': f'Tournament field updated for {tournament["tournament_name"]}',
+        'field_version': version,
+        'timestamp': datetime.now(timezone.utc).isoformat()
+    }
+    if profiler.enabled:
+        response['memory_profile'] = profiler.report()
+    return response, 200
@@ -0,0 +1,82 @@
+"""
+LRU Cache
+
+Thread-safe in-instance cache with a TTL and least-recently-used eviction
+bounded by both entry count and total size in bytes. Expired entries are
+still returned (marked stale) so callers can revalidate them cheaply
+instead of refetching.
+"""
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+
+class CacheEntry:
+    """A cached value with its size and expiry"""
+
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: Any, size: int, expires_at: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class LRUCache:
+    """LRU cache bounded by max_entries and max_bytes, with per-entry TTL"""
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 32 * 1024 * 1024, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get an entry (fresh or stale) and mark it recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, size: int) -> None:
+        """Store a value, evicting least recently used entries to stay within bounds"""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= old.size
+            if size > self.max_bytes:
+                return
+            self._entries[key] = CacheEntry(value, size, time.monotonic() + self.ttl_seconds)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def refresh(self, key: Hashable) -> None:
+        """Restart an entry's TTL after revalidating it"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                entry.expires_at = time.monotonic() + self.ttl_seconds
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self._bytes -= entry.size
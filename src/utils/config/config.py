@@ -0,0 +1,200 @@
+"""
+Configuration Provider
+
+Loads configuration once per instance. Secrets come from one source:
+- env: process environment (plus a local .env file)
+- file: JSON file of name -> value, a local stand-in for Secret Manager
+- secret_manager: latest version of each secret in Google Secret Manager
+
+Anything the secret source does not have falls back to the environment.
+Values are cached with a TTL so rotated secrets are picked up without a
+redeploy. Only key names are ever logged, never values.
+"""
+
+from google.api_core.exceptions import NotFound
+from google.cloud import secretmanager
+from dotenv import load_dotenv
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+
+# Keys each kind of client needs, validated at cold start
+REQUIRED_KEYS = {
+    "db": ("DB_USER", "DB_PASS", "DB_NAME", "INSTANCE_CONNECTION_STRING_FULL"),
+    "sportcontent": ("SPORTCONTENTAPI_KEY",),
+    "datagolf": ("DATAGOLF_KEY",),
+}
+
+
+class ConfigError(Exception):
+    """Raised when required configuration is missing or invalid"""
+
+
+def clean_value(value: Optional[str]) -> Optional[str]:
+    """Strip surrounding quotes and whitespace from a raw value"""
+    return value.strip('"').strip("'").strip() if value else None
+
+
+class EnvSource:
+    """Reads values from the process environment"""
+
+    name = "env"
+
+    def get(self, key: str) -> Optional[str]:
+        return os.getenv(key)
+
+
+class FileSource:
+    """Reads values from a JSON file (local stand-in for Secret Manager)"""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def get(self, key: str) -> Optional[str]:
+        with open(self.path) as f:
+            return json.load(f).get(key)
+
+
+class SecretManagerSource:
+    """Reads the latest version of each secret from Google Secret Manager"""
+
+    name = "secret_manager"
+
+    def __init__(self, project_id: str, client=None):
+        self.project_id = project_id
+        self.client = client or secretmanager.SecretManagerServiceClient()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            response = self.client.access_secret_version(
+                name=f"projects/{self.project_id}/secrets/{key}/versions/latest"
+            )
+            return response.payload.data.decode("utf-8")
+        except NotFound:
+            return None
+
+
+class Config:
+    """Cached, validated access to configuration values"""
+
+    def __init__(self, source=None, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.source = source or EnvSource()
+        self.ttl_seconds = ttl_seconds
+        self._env = EnvSource()
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def __repr__(self) -> str:
+        return f"Config(source={self.source.name}, cached_keys={sorted(self._cache)})"
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Get a value, loading it from the source when not cached or expired.
+
+        Loads hold a per-key lock, so a slow Secret Manager fetch only blocks
+        callers waiting on the same key.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            cached = self._cache.get(key)
+            if cached and cached[1] > time.monotonic():
+                value = cached[0]
+            else:
+                try:
+                    value = self.source.get(key)
+                except Exception as e:
+                    logger.error(f"Error loading {key} from {self.source.name} config source: {type(e).__name__}")
+                    value = None
+                if value is None and self.source is not self._env:
+                    value = self._env.get(key)
+                value = clean_value(value)
+                self._cache[key] = (value, time.monotonic() + self.ttl_seconds)
+        return value if value is not None else default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self.get(key)
+        return default if value is None else value.lower() in ("1", "true", "yes")
+
+    def get_int(self, key: str, default: int) -> int:
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ConfigError(f"{key} must be an integer")
+
+    def get_float(self, key: str, default: float) -> float:
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            raise ConfigError(f"{key} must be a number")
+
+    def validate(self, *groups: str) -> None:
+        """
+        Check that every key in the given REQUIRED_KEYS groups is set.
+
+        Raises:
+            ConfigError: Naming (never showing) the missing keys
+        """
+        missing = [key for group in groups for key in REQUIRED_KEYS[group] if not self.get(key)]
+        if missing:
+            raise ConfigError(f"Missing required configuration: {', '.join(missing)}")
+
+    def db_config(self) -> Dict[str, Optional[str]]:
+        """Database connection settings"""
+        return {
+            'user': self.get('DB_USER'),
+            'password': self.get('DB_PASS'),
+            'database': self.get('DB_NAME'),
+            'instance_connection_string': self.get('INSTANCE_CONNECTION_STRING_FULL')
+        }
+
+
+def build_source():
+    """Choose the secret source from CONFIG_SOURCE (env, file or secret_manager)"""
+    source = os.getenv("CONFIG_SOURCE", "env")
+    if source == "file":
+        return FileSource(os.getenv("SECRETS_FILE", "secrets.local.json"))
+    if source == "secret_manager":
+        return SecretManagerSource(os.getenv("GOOGLE_CLOUD_PROJECT"))
+    if source != "env":
+        raise ConfigError(f"Unknown CONFIG_SOURCE: {source}")
+    return EnvSource()
+
+
+_config: Optional[Config] = None
+_config_lock = threading.Lock()
+
+
+def get_config() -> Config:
+    """Get the instance-wide Config, creating it on first use"""
+    global _config
+    with _config_lock:
+        if _config is None:
+            load_dotenv()
+            source = build_source()
+            _config = Config(source, float(os.getenv("CONFIG_TTL_SECONDS", DEFAULT_TTL_SECONDS)))
+            logger.info(f"Loaded configuration from {source.name} source")
+        return _config
+
+
+def reset_config() -> None:
+    """Drop the cached Config so the next get_config() reloads (for tests)"""
+    global _config
+    with _config_lock:
+        _config = None
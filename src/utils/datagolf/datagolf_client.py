@@ -0,0 +1,98 @@
+"""
+DataGolf API Client
+
+Handles fetching field, rankings and prediction data from the DataGolf API.
+Requests share the "datagolf" budget so concurrent callers stay within the
+API's rate limit.
+"""
+import requests
+import logging
+from typing import Dict, Any, Optional
+from src.utils.config.config import get_config
+from src.utils.rate_limit.rate_limiter import get_api_budget
+
+logger = logging.getLogger(__name__)
+
+# API Configuration
+DATAGOLF_URL = "https://feeds.datagolf.com"
+
+
+def _get(path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Make a budgeted GET request against the DataGolf API.
+
+    Raises:
+        QuotaExceededError: If the daily quota is used up
+        requests.exceptions.RequestException: If API request fails (message
+            names only the path and status, never the keyed URL)
+    """
+    get_api_budget("datagolf").acquire()
+    try:
+        response = requests.get(
+            f"{DATAGOLF_URL}/{path}",
+            params={**(params or {}), "file_format": "json", "key": get_config().get("DATAGOLF_KEY")}
+        )
+        response.raise_for_status()
+        return response.json()
+
+    except requests.exceptions.RequestException as e:
+        # The request URL carries the API key, so never log or re-raise the original message
+        status_code = getattr(e.response, "status_code", None)
+        reason = f"status {status_code}" if status_code else type(e).__name__
+        logger.error(f"Error fetching DataGolf {path}: {reason}")
+        raise type(e)(f"DataGolf {path} request failed: {reason}", response=e.response) from None
+
+
+def fetch_field_updates(tour: str = "pga") -> Dict[str, Any]:
+    """
+    Fetch the current tournament field from DataGolf.
+
+    Args:
+        tour: DataGolf tour code (pga, euro, kft, ...)
+
+    Returns:
+        Dict containing field data
+    """
+    logger.info(f"Fetching DataGolf field updates for tour {tour}")
+    return _get("field-updates", {"tour": tour})
+
+
+def fetch_rankings() -> Dict[str, Any]:
+    """
+    Fetch DataGolf rankings (includes OWGR rank).
+
+    Returns:
+        Dict containing rankings data
+    """
+    logger.info("Fetching DataGolf rankings")
+    return _get("preds/get-dg-rankings")
+
+
+def fetch_predictions(tour: str = "pga", odds_format: str = "percent") -> Dict[str, Any]:
+    """
+    Fetch pre-tournament predictions from DataGolf.
+
+    Args:
+        tour: DataGolf tour code
+        odds_format: percent, american, decimal or fraction
+
+    Returns:
+        Dict containing prediction data
+    """
+    logger.info(f"Fetching DataGolf predictions for tour {tour}")
+    return _get("preds/pre-tournament", {"tour": tour, "odds_format": odds_format})
+
+
+def fetch_owgr_ranks() -> Dict[int, int]:
+    """
+    Fetch current OWGR ranks keyed by DataGolf player ID.
+
+    Returns:
+        Dict of dg_id -> owgr_rank (players without a rank are omitted)
+    """
+    rankings = fetch_rankings().get("rankings", [])
+    return {
+        player["dg_id"]: player["owgr_rank"]
+        for player in rankings
+        if player.get("owgr_rank") is not None
+    }
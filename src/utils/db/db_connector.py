@@ -1,53 +1,76 @@
 from google.cloud.sql.connector import Connector
 from google.cloud import firestore
 import sqlalchemy
-import os
 import logging
-from typing import Any, Dict
-from dotenv import load_dotenv
+import threading
+from typing import Any, Dict, Optional
+from src.utils.config.config import get_config
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-load_dotenv()
+def get_db_config() -> Dict[str, str]:
+    """Get database configuration from the cached config provider"""
+    return get_config().db_config()
 
-def clean_env(var_name: str, default: str = None) -> str:
-    """Clean environment variable values"""
-    value = os.getenv(var_name, default)
-    return value.strip('"').strip("'").strip() if value else None
+def get_pool_config(pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> Dict[str, int]:
+    """
+    Get connection pool settings.
 
-def get_db_config() -> Dict[str, str]:
-    """Get database configuration from environment"""
+    Defaults come from DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT /
+    DB_POOL_RECYCLE, so each function can be sized through its own
+    deployment config. Explicit arguments take precedence.
+    """
+    config = get_config()
     return {
-        'user': clean_env('DB_USER'),
-        'password': clean_env('DB_PASS'),
-        'database': clean_env('DB_NAME'),
-        'instance_connection_string': clean_env('INSTANCE_CONNECTION_STRING_FULL')
+        'pool_size': pool_size if pool_size is not None else config.get_int('DB_POOL_SIZE', 5),
+        'max_overflow': max_overflow if max_overflow is not None else config.get_int('DB_MAX_OVERFLOW', 2),
+        'pool_timeout': config.get_int('DB_POOL_TIMEOUT', 30),
+        'pool_recycle': config.get_int('DB_POOL_RECYCLE', 1800)
     }
 
 # Initialize connectors
 sql_connector = Connector()
 firestore_db = firestore.Client()
 
-def get_db_connection() -> Any:
-    """Get SQLAlchemy database engine"""
+def connect() -> Any:
+    """
+    Open a Cloud SQL connection for the engine's pool.
+
+    Credentials are read for every new connection, so a rotated DB_PASS is
+    used once the cached config refreshes, without rebuilding the engine.
+    """
+    config = get_db_config()
+    return sql_connector.connect(
+        config['instance_connection_string'],
+        "pymysql",
+        user=config['user'],
+        password=config['password'],
+        db=config['database']
+    )
+
+# One engine (and so one connection pool) per instance for each pool configuration
+_engines: Dict[tuple, Any] = {}
+_engines_lock = threading.Lock()
+
+def get_db_connection(pool_size: Optional[int] = None, max_overflow: Optional[int] = None) -> Any:
+    """
+    Get the instance's SQLAlchemy database engine.
+
+    The engine is created on first use and reused by later invocations, so
+    the pool settings bound the connections each instance holds.
+    """
     try:
-        config = get_db_config()
-        engine = sqlalchemy.create_engine(
-            "mysql+pymysql://",
-            creator=lambda: sql_connector.connect(
-                config['instance_connection_string'],
-                "pymysql",
-                user=config['user'],
-                password=config['password'],
-                db=config['database']
-            ),
-            pool_size=5,
-            max_overflow=2,
-            pool_timeout=30,
-            pool_recycle=1800
-        )
-        return engine
+        pool_config = get_pool_config(pool_size, max_overflow)
+        key = tuple(sorted(pool_config.items()))
+        with _engines_lock:
+            if key not in _engines:
+                _engines[key] = sqlalchemy.create_engine(
+                    "mysql+pymysql://",
+                    creator=connect,
+                    **pool_config
+                )
+            return _engines[key]
     except Exception as e:
         logger.error(f"Error creating database connection: {e}")
         raise
@@ -55,6 +78,10 @@ def get_db_connection() -> Any:
 def cleanup():
     """Cleanup database connections"""
     try:
+        with _engines_lock:
+            for engine in _engines.values():
+                engine.dispose()
+            _engines.clear()
         sql_connector.close()
     except Exception as e:
         logger.error(f"Error cleaning up SQL connection: {e}")
\ No newline at end of file
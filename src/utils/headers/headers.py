@@ -1,11 +1,10 @@
-import os
-from dotenv import load_dotenv
+from typing import Dict
+from src.utils.config.config import get_config
 
-load_dotenv()
 
-sportcontentapi_key = os.getenv("SPORTCONTENTAPI_KEY3")
-print(sportcontentapi_key)
-sportcontentapi_headers = {
-    "X-RapidAPI-Key": sportcontentapi_key,
-    "X-RapidAPI-Host": "golf-leaderboard-data.p.rapidapi.com"
-}
\ No newline at end of file
+def get_sportcontentapi_headers() -> Dict[str, str]:
+    """Request headers for the SportContent API"""
+    return {
+        "X-RapidAPI-Key": get_config().get("SPORTCONTENTAPI_KEY"),
+        "X-RapidAPI-Host": "golf-leaderboard-data.p.rapidapi.com"
+    }
@@ -0,0 +1,61 @@
+"""
+Memory Profiler
+
+tracemalloc-based profiling of pipeline stages. Each stage records the peak
+Python heap allocated while it ran and the memory it left behind, so the
+stage that drives a function over its memory tier is easy to spot.
+"""
+
+from contextlib import contextmanager
+import logging
+import resource
+import tracemalloc
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryProfiler:
+    """Records peak memory per named stage; a no-op when disabled"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._started_tracing = False
+
+    def __enter__(self) -> "MemoryProfiler":
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the enclosed block as one stage"""
+        if not self.enabled or not tracemalloc.is_tracing():
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.stages[name] = {
+                "peak_kb": round((peak - start) / 1024, 1),
+                "retained_kb": round((current - start) / 1024, 1)
+            }
+
+    def report(self) -> Dict[str, Any]:
+        """Log and return per-stage peaks plus the process's max RSS"""
+        max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        for name, stats in self.stages.items():
+            logger.info(f"Memory [{name}]: peak {stats['peak_kb']} KB, retained {stats['retained_kb']} KB")
+        logger.info(f"Memory: max RSS {max_rss_kb} KB")
+        return {"stages": self.stages, "max_rss_kb": max_rss_kb}
@@ -0,0 +1,232 @@
+"""
+API Request Budgeting
+
+Shared rate limiting for third-party APIs. Every client for a given API
+acquires from the same ApiBudget, which combines:
+- a token bucket that smooths request bursts within this instance
+- a daily quota, either in-memory (per instance) or a Firestore counter
+  shared by all instances
+
+Defaults in API_LIMITS can be overridden per API through config, e.g.
+SPORTCONTENT_RATE_PER_SECOND, SPORTCONTENT_BURST and SPORTCONTENT_DAILY_LIMIT.
+"""
+
+from google.cloud import firestore
+from datetime import datetime, timezone
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from src.utils.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+QUOTA_COLLECTION = "api_quotas"
+
+# Default requests per second, burst size and daily quota for each API
+API_LIMITS = {
+    "sportcontent": {"rate": 2.0, "capacity": 5, "daily_limit": 2000},
+    "datagolf": {"rate": 0.75, "capacity": 5, "daily_limit": None},
+}
+
+# Instances assumed to share the daily quota while Firestore is unavailable;
+# each falls back to daily_limit / this many requests
+DEFAULT_FALLBACK_INSTANCES = 10
+
+
+class QuotaExceededError(Exception):
+    """Raised when an API's daily quota has been used up"""
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilling at `rate` tokens per second"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+class DailyQuota:
+    """In-memory daily request counter, reset at UTC midnight"""
+
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self._day = _today()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int = 1) -> bool:
+        """Record `amount` requests, returning False if that would exceed the limit"""
+        with self._lock:
+            today = _today()
+            if today != self._day:
+                self._day, self._used = today, 0
+            if self.limit is not None and self._used + amount > self.limit:
+                return False
+            self._used += amount
+            return True
+
+
+class FirestoreDailyQuota:
+    """
+    Daily request counter shared across instances via Firestore.
+
+    Units are leased from the shared counter in blocks so that most
+    requests only touch the local lease rather than Firestore. If
+    Firestore is unavailable, requests are counted against an in-memory
+    quota capped at this instance's share of the limit (fallback_limit)
+    until it recovers, so a transient error is not reported as an exhausted
+    quota and instances together stay within the daily limit.
+    """
+
+    def __init__(
+        self,
+        db: firestore.Client,
+        api_name: str,
+        limit: Optional[int],
+        block_size: int = 10,
+        fallback_limit: Optional[int] = None
+    ):
+        self.db = db
+        self.api_name = api_name
+        self.limit = limit
+        self.block_size = block_size
+        self._day = _today()
+        self._leased = 0
+        if fallback_limit is None and limit is not None:
+            fallback_limit = limit // DEFAULT_FALLBACK_INSTANCES
+        self._fallback = DailyQuota(fallback_limit)
+        self._lock = threading.Lock()
+
+    def _reserve(self, day: str, amount: int) -> int:
+        """Reserve up to `amount` units from today's shared counter"""
+        doc_ref = self.db.collection(QUOTA_COLLECTION).document(f"{self.api_name}_{day}")
+        limit = self.limit
+
+        @firestore.transactional
+        def reserve(transaction) -> int:
+            snapshot = doc_ref.get(transaction=transaction)
+            used = (snapshot.to_dict() or {}).get("count", 0) if snapshot.exists else 0
+            granted = amount if limit is None else max(0, min(amount, limit - used))
+            if granted:
+                transaction.set(doc_ref, {"count": used + granted, "api": self.api_name, "day": day})
+            return granted
+
+        return reserve(self.db.transaction())
+
+    def consume(self, amount: int = 1) -> bool:
+        """Record `amount` requests, returning False if the shared quota is used up"""
+        if self.limit is None:
+            return True
+        with self._lock:
+            today = _today()
+            if today != self._day:
+                self._day, self._leased = today, 0
+            if self._leased < amount:
+                try:
+                    self._leased += self._reserve(today, max(amount - self._leased, self.block_size))
+                except Exception as e:
+                    logger.warning(
+                        f"Error reserving {self.api_name} quota in Firestore, "
+                        f"counting locally: {str(e)}"
+                    )
+                    return self._fallback.consume(amount)
+            if self._leased < amount:
+                return False
+            self._leased -= amount
+            return True
+
+
+class ApiBudget:
+    """Rate limit and daily quota for one API"""
+
+    def __init__(self, name: str, bucket: TokenBucket, quota):
+        self.name = name
+        self.bucket = bucket
+        self.quota = quota
+
+    def acquire(self) -> None:
+        """
+        Wait for a request slot.
+
+        Raises:
+            QuotaExceededError: If the daily quota is used up
+        """
+        if not self.quota.consume():
+            logger.error(f"Daily quota exhausted for {self.name} API")
+            raise QuotaExceededError(f"Daily quota exhausted for {self.name} API")
+        self.bucket.acquire()
+
+
+def get_api_limits(api_name: str) -> Dict[str, Any]:
+    """API_LIMITS for one API with any configured overrides applied"""
+    config = get_config()
+    prefix = api_name.upper()
+    defaults = API_LIMITS[api_name]
+    return {
+        "rate": config.get_float(f"{prefix}_RATE_PER_SECOND", defaults["rate"]),
+        "capacity": config.get_int(f"{prefix}_BURST", defaults["capacity"]),
+        "daily_limit": config.get_int(f"{prefix}_DAILY_LIMIT", defaults["daily_limit"])
+    }
+
+
+_budgets: Dict[str, ApiBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_api_budget(api_name: str) -> ApiBudget:
+    """Get the instance-wide budget for an API, creating it on first use"""
+    with _budgets_lock:
+        if api_name not in _budgets:
+            limits = get_api_limits(api_name)
+            _budgets[api_name] = ApiBudget(
+                api_name,
+                TokenBucket(limits["rate"], limits["capacity"]),
+                DailyQuota(limits["daily_limit"])
+            )
+        return _budgets[api_name]
+
+
+def use_firestore_quotas(db: firestore.Client) -> None:
+    """Share daily quotas across instances through Firestore counters"""
+    instances = get_config().get_int("QUOTA_FALLBACK_INSTANCES", DEFAULT_FALLBACK_INSTANCES)
+    for api_name in API_LIMITS:
+        budget = get_api_budget(api_name)
+        limit = budget.quota.limit
+        if limit is None or isinstance(budget.quota, FirestoreDailyQuota):
+            continue
+        budget.quota = FirestoreDailyQuota(db, api_name, limit, fallback_limit=limit // max(1, instances))
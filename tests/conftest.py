@@ -1,8 +1,12 @@
 import pytest
 import os
 from dotenv import load_dotenv
+from src.utils.config.config import reset_config
 
 @pytest.fixture(autouse=True)
 def env_setup(monkeypatch):
     """Load test environment variables for all tests"""
-    load_dotenv('.env.test')
\ No newline at end of file
+    load_dotenv('.env.test')
+    reset_config()
+    yield
+    reset_config()
\ No newline at end of file
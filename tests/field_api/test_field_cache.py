@@ -0,0 +1,107 @@
+"""
+Tests for the cached tournament field read API
+"""
+
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+from src.field_api import field_cache
+from src.field_api.field_cache import get_cached_field, build_field_response, CachedField
+
+MOCK_DOC = {
+    "field": {"results": {"entry_list": [{"player_id": 100240}]}},
+    "content_hash": "abc123",
+    "data_source": "sportcontent_api"
+}
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    field_cache.field_cache = field_cache.LRUCache(ttl_seconds=60)
+    yield
+
+@pytest.fixture
+def firestore_reads():
+    with patch.object(field_cache, "get_tournament_field", return_value=dict(MOCK_DOC)) as get_field, \
+         patch.object(field_cache, "get_tournament_field_hash", return_value="abc123") as get_hash:
+        yield get_field, get_hash
+
+def test_cache_hit_skips_firestore(firestore_reads):
+    """Fresh entries are served without any Firestore read"""
+    get_field, get_hash = firestore_reads
+
+    first = get_cached_field(None, "659")
+    second = get_cached_field(None, "659")
+
+    assert second is first
+    assert get_field.call_count == 1
+    get_hash.assert_not_called()
+    assert json.loads(first.body)["content_hash"] == "abc123"
+
+def test_stale_entry_revalidated_by_hash(firestore_reads):
+    """Expired entries with an unchanged hash are kept"""
+    get_field, get_hash = firestore_reads
+    field_cache.field_cache.ttl_seconds = 0
+    first = get_cached_field(None, "659")
+
+    assert get_cached_field(None, "659") is first
+    assert get_field.call_count == 1
+    get_hash.assert_called_once_with(None, "659", raise_errors=True)
+
+def test_stale_entry_reloaded_when_hash_changes(firestore_reads):
+    """A new writer hash invalidates the cached field"""
+    get_field, get_hash = firestore_reads
+    field_cache.field_cache.ttl_seconds = 0
+    get_cached_field(None, "659")
+    get_hash.return_value = "def456"
+    get_field.return_value = dict(MOCK_DOC, content_hash="def456")
+
+    assert get_cached_field(None, "659").etag == '"def456"'
+    assert get_field.call_count == 2
+
+def test_stale_entry_served_when_firestore_fails(firestore_reads):
+    """A Firestore error keeps serving the stale entry instead of evicting it"""
+    get_field, get_hash = firestore_reads
+    field_cache.field_cache.ttl_seconds = 0
+    first = get_cached_field(None, "659")
+    get_hash.side_effect = Exception("Firestore error")
+
+    assert get_cached_field(None, "659") is first
+    assert len(field_cache.field_cache) == 1
+    get_hash.assert_called_once_with(None, "659", raise_errors=True)
+
+def test_firestore_error_without_cached_entry_raises(firestore_reads):
+    """With nothing cached, a Firestore error surfaces as an error rather than a missing field"""
+    get_field, _ = firestore_reads
+    get_field.side_effect = Exception("Firestore error")
+
+    with pytest.raises(Exception, match="Firestore error"):
+        get_cached_field(None, "659")
+
+def test_missing_field_not_cached(firestore_reads):
+    get_field, _ = firestore_reads
+    get_field.return_value = None
+    assert get_cached_field(None, "999") is None
+    assert len(field_cache.field_cache) == 0
+
+def test_response_not_modified():
+    """Matching If-None-Match returns an empty 304"""
+    cached = CachedField("abc123", b'{"field": {}}')
+
+    body, status, headers = build_field_response(cached, if_none_match='"old", "abc123"')
+
+    assert (body, status) == (b"", 304)
+    assert headers["ETag"] == '"abc123"'
+
+def test_response_gzip():
+    """Gzip is used when the client accepts it"""
+    cached = CachedField("abc123", b'{"field": {}}')
+
+    body, status, headers = build_field_response(cached, accept_encoding="gzip, deflate")
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(body) == cached.body
+
+    body, status, headers = build_field_response(cached, if_none_match='"old"')
+    assert body == cached.body
+    assert "Content-Encoding" not in headers
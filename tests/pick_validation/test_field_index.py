@@ -0,0 +1,127 @@
+"""
+Tests for pick validation field index
+"""
+
+import pytest
+import threading
+from unittest.mock import Mock, patch
+from datetime import date, datetime, time, timezone
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from src.pick_validation import field_index
+from src.pick_validation.field_index import (
+    load_field_index, get_field_index, validate_picks, get_lock_time
+)
+from src.models import Tournament, TournamentGolfer, Golfer, Base
+
+BEFORE_LOCK = datetime(2024, 5, 23, 11, 0, tzinfo=timezone.utc)
+AFTER_LOCK = datetime(2024, 5, 23, 12, 0, tzinfo=timezone.utc)
+
+@pytest.fixture
+def db_session():
+    """Create test database with a field of active, alternate and withdrawn golfers"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    session.add_all([
+        Tournament(id=1, sportcontent_api_id=659, year=2024, tournament_name="Charles Schwab Challenge",
+                   start_date=date(2024, 5, 23), start_time=time(7, 0), time_zone="America/Chicago",
+                   end_date=date(2024, 5, 26)),
+        *[Golfer(id=str(i), first_name="First", last_name=f"Last{i}", full_name=f"Golfer {i}") for i in range(1, 5)],
+        TournamentGolfer(tournament_id=1, golfer_id="1", year=2024),
+        TournamentGolfer(tournament_id=1, golfer_id="2", year=2024, is_alternate=True),
+        TournamentGolfer(tournament_id=1, golfer_id="3", year=2024, is_active=False),
+        TournamentGolfer(tournament_id=1, golfer_id="4", year=2024, is_most_recent=False),
+    ])
+    session.commit()
+
+    yield session
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+@pytest.fixture(autouse=True)
+def reset_indexes():
+    field_index._indexes.clear()
+    yield
+    field_index._indexes.clear()
+
+def test_lock_time_uses_tournament_time_zone():
+    """7:00 AM Central is 12:00 UTC during daylight saving time"""
+    tournament = Tournament(start_date=date(2024, 5, 23), start_time=time(7, 0), time_zone="America/Chicago")
+    assert get_lock_time(tournament) == AFTER_LOCK
+
+def test_validate_picks_against_field(db_session):
+    """Each pick gets a result with the reason it is invalid"""
+    index = load_field_index(db_session, 1, "v1")
+    picks = [{"pick_id": i, "golfer_id": g} for i, g in enumerate(["1", "2", "3", "4", 99])]
+
+    results = validate_picks(index, picks, now=BEFORE_LOCK)
+
+    assert [(r["pick_id"], r["valid"], r["reason"]) for r in results] == [
+        (0, True, None),
+        (1, False, "golfer_is_alternate"),
+        (2, False, "golfer_withdrawn"),
+        (3, False, "not_in_field"),
+        (4, False, "not_in_field"),
+    ]
+
+def test_validate_picks_after_lock(db_session):
+    """Picks after the tournament start are rejected"""
+    index = load_field_index(db_session, 1)
+
+    results = validate_picks(index, [{"pick_id": 1, "golfer_id": "1"}], now=AFTER_LOCK)
+
+    assert results == [{"pick_id": 1, "valid": False, "reason": "tournament_locked"}]
+
+def test_validate_picks_unknown_tournament(db_session):
+    """Picks for a missing tournament are rejected"""
+    assert load_field_index(db_session, 999) is None
+    results = validate_picks(None, [{"pick_id": 1, "golfer_id": "1"}])
+    assert results[0]["reason"] == "unknown_tournament"
+
+def test_get_field_index_reloads_on_new_version(db_session):
+    """The index is reused until the published version changes"""
+    with patch.object(field_index, "get_published_field_version", return_value="v1"), \
+         patch.object(field_index, "load_field_index", wraps=load_field_index) as mock_load, \
+         patch.object(field_index, "VERSION_CHECK_INTERVAL", 0):
+        first = get_field_index(db_session, Mock(), 1)
+        assert get_field_index(db_session, Mock(), 1) is first
+        assert mock_load.call_count == 1
+
+        field_index.get_published_field_version.return_value = "v2"
+        second = get_field_index(db_session, Mock(), 1)
+        assert second is not first
+        assert second.version == "v2"
+        assert mock_load.call_count == 2
+
+def test_get_field_index_skips_version_check_within_interval(db_session):
+    """Version is not re-read within the check interval"""
+    with patch.object(field_index, "get_published_field_version", return_value="v1") as mock_version:
+        get_field_index(db_session, Mock(), 1)
+        get_field_index(db_session, Mock(), 1)
+        assert mock_version.call_count == 1
+
+def test_get_field_index_reload_does_not_block_other_tournaments():
+    """A slow reload for one tournament does not hold up another tournament"""
+    release = threading.Event()
+
+    def load(session, tournament_id, version):
+        if tournament_id == 1:
+            release.wait(5)
+        return Mock(version=version, checked_at=0)
+
+    with patch.object(field_index, "get_published_field_version", return_value="v1"), \
+         patch.object(field_index, "load_field_index", side_effect=load):
+        slow = threading.Thread(target=get_field_index, args=(Mock(), Mock(), 1))
+        slow.start()
+        try:
+            fast = threading.Thread(target=get_field_index, args=(Mock(), Mock(), 2))
+            fast.start()
+            fast.join(1)
+            assert not fast.is_alive()
+            assert 2 in field_index._indexes
+        finally:
+            release.set()
+            slow.join()
@@ -0,0 +1,34 @@
+"""
+Tests for SportContent schedule client functionality
+"""
+
+import pytest
+import requests
+from unittest.mock import patch
+from src.schedule_sync.api_client import fetch_schedule, SPORTCONTENTAPI_FIXTURES_URL
+
+MOCK_SCHEDULE = {"results": [{"id": 659, "name": "Charles Schwab Challenge"}]}
+
+@pytest.fixture(autouse=True)
+def mock_budget():
+    with patch('src.schedule_sync.api_client.get_api_budget') as mock_get_budget:
+        yield mock_get_budget.return_value
+
+@patch('requests.get')
+def test_fetch_schedule_success(mock_get, mock_budget):
+    """Test successful schedule request"""
+    mock_get.return_value.json.return_value = MOCK_SCHEDULE
+
+    result = fetch_schedule(2, 2024)
+
+    assert result == MOCK_SCHEDULE
+    mock_budget.acquire.assert_called_once()
+    assert mock_get.call_args[0][0] == f"{SPORTCONTENTAPI_FIXTURES_URL}/2/2024"
+
+@patch('requests.get')
+def test_fetch_schedule_error(mock_get):
+    """Test API error handling"""
+    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        fetch_schedule(2, 2024)
@@ -0,0 +1,119 @@
+"""
+Tests for schedule sync database operations
+"""
+
+import pytest
+from datetime import date
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from src.schedule_sync.db_client import parse_location, parse_schedule, sync_schedule
+from src.models import Tournament, Base
+
+MOCK_SCHEDULE = {"results": [
+    {"id": 659, "type": "Stroke Play", "tour_id": 2, "name": "Charles Schwab Challenge",
+     "country": "Fort Worth, USA", "course": "Colonial Country Club",
+     "start_date": "2024-05-23 00:00:00", "end_date": "2024-05-26 00:00:00", "timezone": "America/Chicago"},
+    {"id": 660, "type": "Stroke Play", "tour_id": 2, "name": "the Memorial Tournament",
+     "country": "Dublin, Ohio, USA", "course": "Muirfield Village Golf Club",
+     "start_date": "2024-06-06 00:00:00", "end_date": "2024-06-09 00:00:00", "timezone": "America/New_York"},
+    {"id": 661, "type": "Match Play", "tour_id": 2, "name": "Dell Match Play",
+     "country": "Austin, USA", "course": "Austin Country Club",
+     "start_date": "2024-03-22 00:00:00", "end_date": "2024-03-26 00:00:00", "timezone": "America/Chicago"},
+]}
+
+@pytest.fixture
+def db_session():
+    """Create test database with one stale tournament and one up-to-date tournament"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    rows = {row["sportcontent_api_id"]: row for row in parse_schedule(MOCK_SCHEDULE, 2)}
+    session.add_all([
+        Tournament(id=1, datagolf_id=21, is_major=False,
+                   **{**rows[659], "course_name": "Colonial", "state": "TX"}),
+        Tournament(id=2, datagolf_id=23, **rows[660]),
+    ])
+    session.commit()
+
+    yield session
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+@pytest.fixture
+def statements(db_session):
+    """Record SQL statements executed on the session's engine"""
+    executed = []
+    event.listen(db_session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: executed.append(statement))
+    return executed
+
+@pytest.mark.parametrize("location_raw,expected", [
+    ("Fort Worth, USA", ("Fort Worth", None)),
+    ("Fort Worth, TX", ("Fort Worth", "TX")),
+    ("Dublin, Ohio, USA", ("Dublin", "Ohio")),
+    ("Dubai", ("Dubai", None)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_location(location_raw, expected):
+    assert parse_location(location_raw) == expected
+
+def test_parse_schedule():
+    """Events map onto Tournament columns (using the API's "City, Country" location shape)"""
+    rows = parse_schedule(MOCK_SCHEDULE, 2)
+
+    assert len(rows) == 3
+    assert rows[0] == {
+        "sportcontent_api_id": 659,
+        "sportcontent_api_tour_id": 2,
+        "year": 2024,
+        "tournament_name": "Charles Schwab Challenge",
+        "tournament_format": "stroke",
+        "start_date": date(2024, 5, 23),
+        "end_date": date(2024, 5, 26),
+        "time_zone": "America/Chicago",
+        "location_raw": "Fort Worth, USA",
+        "course_name": "Colonial Country Club",
+        "city": "Fort Worth",
+        "state": None,
+    }
+    assert rows[2]["tournament_format"] == "match"
+
+def test_parse_schedule_skips_incomplete_events():
+    rows = parse_schedule({"results": [{"id": 1, "name": "TBD"}, {"name": "No id", "start_date": "2024-01-01"}]}, 2)
+    assert rows == []
+
+def test_sync_schedule(db_session, statements):
+    """New and changed events are upserted in one statement after one read"""
+    summary = sync_schedule(db_session, parse_schedule(MOCK_SCHEDULE, 2))
+
+    assert summary == {"fetched": 3, "created": 1, "updated": 1, "unchanged": 1}
+    assert [s.split()[0] for s in statements] == ["SELECT", "INSERT"]
+
+    updated = db_session.get(Tournament, 1)
+    # SportContent has no state for "Fort Worth, USA"; the stored one is kept
+    assert (updated.course_name, updated.city, updated.state) == ("Colonial Country Club", "Fort Worth", "TX")
+    assert updated.datagolf_id == 21
+    created = db_session.query(Tournament).filter_by(sportcontent_api_id=661).one()
+    assert created.tournament_format == "match"
+    assert created.start_time is not None
+
+def test_sync_schedule_rerun_is_read_only(db_session, statements):
+    """An unchanged schedule costs a single read query"""
+    rows = parse_schedule(MOCK_SCHEDULE, 2)
+    sync_schedule(db_session, rows)
+    statements.clear()
+
+    summary = sync_schedule(db_session, rows)
+
+    assert summary == {"fetched": 3, "created": 0, "updated": 0, "unchanged": 3}
+    assert [s.split()[0] for s in statements] == ["SELECT"]
+
+def test_sync_schedule_error(db_session):
+    """Test database error handling"""
+    rows = parse_schedule(MOCK_SCHEDULE, 2)
+    rows[0]["tournament_name"] = None
+
+    assert sync_schedule(db_session, rows) is None
@@ -0,0 +1,66 @@
+"""
+Tests for the tournament field load test harness
+"""
+
+from tools.load_test import (
+    ConnectionStats,
+    make_engine_factory,
+    percentile,
+    recommend_pool_settings,
+    run_load_test,
+    seed_database,
+    summarize,
+)
+
+
+def test_percentile():
+    """Nearest-rank percentiles over unsorted latencies"""
+    values = [0.5, 0.1, 0.3, 0.2, 0.4]
+    assert percentile(values, 50) == 0.3
+    assert percentile(values, 99) == 0.5
+    assert percentile([], 50) == 0.0
+
+def test_summarize():
+    """Throughput and latency are reported alongside connection stats"""
+    report = summarize([0.1, 0.2], errors=1, elapsed=2.0, stats={"engines_created": 3})
+
+    assert report["invocations"] == 2
+    assert report["errors"] == 1
+    assert report["throughput_per_second"] == 1.0
+    assert report["p50_ms"] == 100.0
+    assert report["engines_created"] == 3
+
+def test_recommend_pool_settings_within_budget():
+    """The pool covers the measured peak and overflow stays inside the per-instance share"""
+    rec = recommend_pool_settings(peak_per_engine=2, max_connections=100, max_instances=20)
+
+    assert rec["per_instance_budget"] == 4
+    assert (rec["DB_POOL_SIZE"], rec["DB_MAX_OVERFLOW"]) == (2, 2)
+    assert rec["worst_case_connections"] == 80
+    assert rec["fits"]
+    assert "warning" not in rec
+
+def test_recommend_pool_settings_over_budget():
+    """A peak above the per-instance share is capped and flagged"""
+    rec = recommend_pool_settings(peak_per_engine=7, max_connections=100, max_instances=40)
+
+    assert rec["per_instance_budget"] == 2
+    assert (rec["DB_POOL_SIZE"], rec["DB_MAX_OVERFLOW"]) == (2, 0)
+    assert not rec["fits"]
+    assert "warning" in rec
+
+def test_run_load_test_sqlite(tmp_path):
+    """Concurrent invocations against SQLite with one engine per simulated instance"""
+    db_url = f"sqlite:///{tmp_path / 'load_test.db'}"
+    stats = ConnectionStats()
+    get_engine = make_engine_factory(db_url, stats, pool_size=1, max_overflow=0)
+    seed_database(get_engine(), field_size=20)
+
+    report = run_load_test(get_engine, invocations=6, concurrency=3, field_size=20, stats=stats)
+
+    assert report["invocations"] == 6
+    assert report["errors"] == 0
+    # One engine for seeding on this thread plus one per worker thread
+    assert report["engines_created"] == 4
+    assert report["peak_checked_out_per_engine"] == 1
+    assert report["peak_checked_out"] <= 3
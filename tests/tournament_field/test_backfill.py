@@ -0,0 +1,124 @@
+"""
+Tests for historical tournament field backfill
+"""
+
+import json
+import pytest
+from unittest.mock import Mock
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from src.tournament_field.backfill import backfill_tournament_fields, load_checkpoint
+from src.models import Tournament, TournamentGolfer, Golfer, Base
+
+
+def make_field(*player_ids):
+    return {"results": {"entry_list": [{"player_id": p} for p in player_ids]}}
+
+MOCK_FIELDS = {
+    659: make_field(100240, 103138),
+    660: make_field(100240),
+    661: make_field(103138),
+}
+
+@pytest.fixture
+def db_session():
+    """Create test database with tournaments across two seasons"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    session.add_all([
+        Tournament(id=1, sportcontent_api_id=659, year=2022, tournament_name="A",
+                   start_date=date(2022, 5, 1), end_date=date(2022, 5, 4)),
+        Tournament(id=2, sportcontent_api_id=660, year=2023, tournament_name="B",
+                   start_date=date(2023, 5, 1), end_date=date(2023, 5, 4)),
+        Tournament(id=3, sportcontent_api_id=661, year=2024, tournament_name="C",
+                   start_date=date(2024, 5, 1), end_date=date(2024, 5, 4)),
+        Golfer(id="1", first_name="Tyson", last_name="Alexander",
+               full_name="Tyson Alexander", sportcontent_api_id=100240),
+        Golfer(id="2", first_name="Erik", last_name="Barnes",
+               full_name="Erik Barnes", sportcontent_api_id=103138),
+    ])
+    session.commit()
+
+    yield session
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+def test_backfill_year_range(db_session, tmp_path):
+    """Only tournaments in the year range are fetched and written"""
+    fetch = Mock(side_effect=lambda api_id: MOCK_FIELDS[api_id])
+
+    summary = backfill_tournament_fields(
+        db_session, 2022, 2023, fetch=fetch
+    )
+
+    assert summary["processed"] == 2
+    assert summary["entries"] == 3
+    assert summary["failed"] == []
+    assert sorted(c.args[0] for c in fetch.call_args_list) == [659, 660]
+    rows = db_session.query(TournamentGolfer).all()
+    assert {(r.tournament_id, r.year) for r in rows} == {(1, 2022), (2, 2023)}
+    assert all(r.is_most_recent for r in rows)
+
+def test_backfill_resumes_from_checkpoint(db_session, tmp_path):
+    """Checkpointed tournaments are skipped on rerun"""
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(json.dumps({"completed": [1]}))
+    fetch = Mock(side_effect=lambda api_id: MOCK_FIELDS[api_id])
+
+    summary = backfill_tournament_fields(
+        db_session, 2022, 2023, fetch=fetch,
+        checkpoint_path=str(checkpoint)
+    )
+
+    assert summary["skipped"] == 1
+    assert summary["processed"] == 1
+    fetch.assert_called_once_with(660)
+    assert load_checkpoint(str(checkpoint)) == {1, 2}
+
+def test_backfill_failure_not_checkpointed(db_session, tmp_path):
+    """A failed fetch is reported and left for the next run"""
+    checkpoint = tmp_path / "checkpoint.json"
+
+    def fetch(api_id):
+        if api_id == 660:
+            raise Exception("API Error")
+        return MOCK_FIELDS[api_id]
+
+    summary = backfill_tournament_fields(
+        db_session, 2022, 2023, fetch=fetch,
+        checkpoint_path=str(checkpoint)
+    )
+
+    assert summary["failed"] == [2]
+    assert load_checkpoint(str(checkpoint)) == {1}
+
+def test_backfill_archive_and_replay(db_session, tmp_path):
+    """Fetched payloads are archived and can be replayed without the API"""
+    archive_dir = tmp_path / "archive"
+    fetch = Mock(side_effect=lambda api_id: MOCK_FIELDS[api_id])
+    backfill_tournament_fields(
+        db_session, 2024, 2024, fetch=fetch,
+        archive_dir=str(archive_dir)
+    )
+    assert json.loads((archive_dir / "661.json").read_text()) == MOCK_FIELDS[661]
+
+    replay_fetch = Mock()
+    summary = backfill_tournament_fields(
+        db_session, 2024, 2024, fetch=replay_fetch,
+        archive_dir=str(archive_dir), replay=True
+    )
+
+    replay_fetch.assert_not_called()
+    assert summary["processed"] == 1
+    rows = db_session.query(TournamentGolfer).filter_by(tournament_id=3).all()
+    assert len(rows) == 2
+    assert sum(r.is_most_recent for r in rows) == 1
+
+def test_backfill_replay_requires_archive(db_session):
+    """Replay without an archive directory is rejected"""
+    with pytest.raises(ValueError):
+        backfill_tournament_fields(db_session, 2022, 2023, replay=True)
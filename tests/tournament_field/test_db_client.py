@@ -3,11 +3,15 @@ Tests for database client functionality
 """
 
 import pytest
+import tracemalloc
 from unittest.mock import Mock
-from datetime import datetime
+from datetime import datetime, timedelta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
-from src.tournament_field.db_client import get_upcoming_tournament, update_tournament_entries
+from src.tournament_field.db_client import (
+    get_upcoming_tournament, get_upcoming_tournaments, update_tournament_entries, get_current_field,
+    get_field_golfer_ids
+)
 from src.models import Tournament, TournamentGolfer, Golfer, Base
 
 # Test data
@@ -162,4 +166,129 @@ def test_update_tournament_entries_error(db_session):
     
     result = update_tournament_entries(db_session, 1, MOCK_FIELD_DATA)
     
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+@pytest.fixture
+def field_session():
+    """Create test database with a published field"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+
+    session.add_all([
+        Golfer(id="1", first_name="Tyson", last_name="Alexander", full_name="Tyson Alexander",
+               sportcontent_api_id=100240, datagolf_id=18417, photo_url="https://img/1.png"),
+        Golfer(id="2", first_name="Erik", last_name="Barnes", full_name="Erik Barnes",
+               sportcontent_api_id=103138, datagolf_id=18418),
+        Golfer(id="3", first_name="Aaron", last_name="Baddeley", full_name="Aaron Baddeley",
+               sportcontent_api_id=100001, datagolf_id=18419),
+        TournamentGolfer(tournament_id=1, golfer_id="1", year=2024, is_most_recent=True),
+        TournamentGolfer(tournament_id=1, golfer_id="2", year=2024, is_most_recent=True,
+                         is_alternate=True),
+        TournamentGolfer(tournament_id=1, golfer_id="3", year=2024, is_most_recent=False),
+    ])
+    session.commit()
+
+    yield session
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+def test_get_current_field(field_session):
+    """Only most recent entries are returned, joined to golfer details"""
+    players = get_current_field(field_session, 1)
+
+    assert [p["golfer_id"] for p in players] == ["2", "1"]
+    assert players[1] == {
+        "golfer_id": "1",
+        "display_name": "Tyson Alexander",
+        "photo_url": "https://img/1.png",
+        "is_active": True,
+        "is_alternate": False,
+        "is_injured": False,
+        "rank": None
+    }
+    assert players[0]["is_alternate"] is True
+
+def test_get_current_field_sorted_by_rank(field_session):
+    """Ranked players come first in rank order"""
+    players = get_current_field(field_session, 1, rankings={18417: 12})
+
+    assert [(p["golfer_id"], p["rank"]) for p in players] == [("1", 12), ("2", None)]
+
+def test_get_upcoming_tournaments_window(field_session):
+    """Tournaments across tours inside the look-ahead window are returned"""
+    today = datetime.now().date()
+    field_session.add_all([
+        Tournament(id=10, sportcontent_api_id=700, sportcontent_api_tour_id=2, year=today.year,
+                   tournament_name="PGA Event", start_date=today + timedelta(days=2), end_date=today + timedelta(days=5)),
+        Tournament(id=11, sportcontent_api_id=701, sportcontent_api_tour_id=1, year=today.year,
+                   tournament_name="DP World Event", start_date=today + timedelta(days=3), end_date=today + timedelta(days=6)),
+        Tournament(id=12, sportcontent_api_id=702, year=today.year,
+                   tournament_name="Later Event", start_date=today + timedelta(days=30), end_date=today + timedelta(days=33)),
+    ])
+    field_session.commit()
+
+    tournaments = get_upcoming_tournaments(field_session, days_ahead=7)
+
+    assert [(t["id"], t["tour_id"]) for t in tournaments] == [(10, 2), (11, 1)]
+
+def test_get_upcoming_tournaments_earliest_per_tour(field_session):
+    """Only the earliest not-yet-started tournament on each tour is returned"""
+    today = datetime.now().date()
+    field_session.add_all([
+        Tournament(id=20, sportcontent_api_id=710, sportcontent_api_tour_id=2, year=today.year,
+                   tournament_name="Started Today", start_date=today, end_date=today + timedelta(days=3)),
+        Tournament(id=21, sportcontent_api_id=711, sportcontent_api_tour_id=2, year=today.year,
+                   tournament_name="Next PGA Event", start_date=today + timedelta(days=1), end_date=today + timedelta(days=4)),
+        Tournament(id=22, sportcontent_api_id=712, sportcontent_api_tour_id=2, year=today.year,
+                   tournament_name="Following PGA Event", start_date=today + timedelta(days=6), end_date=today + timedelta(days=9)),
+    ])
+    field_session.commit()
+
+    tournaments = get_upcoming_tournaments(field_session, days_ahead=7)
+
+    assert [t["id"] for t in tournaments] == [21]
+
+@pytest.fixture
+def large_field_session():
+    """Create test database with a 10,000 entrant synthetic field"""
+    engine = create_engine('sqlite:///:memory:')
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.execute(Golfer.__table__.insert(), [
+        {"id": str(i), "first_name": "First", "last_name": f"Last{i}",
+         "full_name": f"Golfer {i}", "sportcontent_api_id": 100000 + i}
+        for i in range(10000)
+    ])
+    session.commit()
+
+    yield session
+
+    session.close()
+    Base.metadata.drop_all(engine)
+
+def test_update_tournament_entries_low_memory(large_field_session):
+    """Low-memory mode writes every entry with a lower peak and an empty identity map"""
+    field_data = {"results": {"entry_list": [{"player_id": 100000 + i} for i in range(10000)]}}
+
+    def peak(low_memory):
+        tracemalloc.start()
+        try:
+            assert update_tournament_entries(large_field_session, 1, field_data, low_memory=low_memory)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    default_peak = peak(low_memory=False)
+    large_field_session.expunge_all()
+    low_memory_peak = peak(low_memory=True)
+
+    assert low_memory_peak < default_peak / 2
+    assert len(large_field_session.identity_map) == 0
+    entries = large_field_session.query(TournamentGolfer).filter_by(is_most_recent=True).count()
+    assert entries == 10000
+
+def test_get_field_golfer_ids(field_session):
+    """Only golfers in the most recent field are returned"""
+    assert get_field_golfer_ids(field_session, 1) == {"1", "2"}
@@ -0,0 +1,62 @@
+"""
+Tests for tournament field dispatcher
+"""
+
+import base64
+import pytest
+from unittest.mock import Mock
+from src.tournament_field.dispatcher import (
+    LocalTaskQueue, PubSubTaskQueue, dispatch_tournament_field_updates, decode_pubsub_task
+)
+
+MOCK_TOURNAMENTS = [
+    {"id": 1, "sportcontent_api_id": 659, "tour_id": 2, "tournament_name": "Charles Schwab Challenge"},
+    {"id": 2, "sportcontent_api_id": 660, "tour_id": 1, "tournament_name": "Soudal Open"},
+]
+
+def test_dispatch_local_queue_runs_each_tournament():
+    """Each tournament becomes one task handled by the worker"""
+    handler = Mock(side_effect=lambda task: ({"status": "success"}, 200))
+    queue = LocalTaskQueue(handler, max_workers=2)
+
+    count = dispatch_tournament_field_updates(MOCK_TOURNAMENTS, queue)
+    results = queue.join()
+
+    assert count == 2
+    assert sorted(c.args[0]["id"] for c in handler.call_args_list) == [1, 2]
+    assert all(r["status"] == "success" and r["attempts"] == 1 for r in results)
+
+def test_local_queue_retries_failed_tasks():
+    """A failing task is retried, then reported once attempts run out"""
+    calls = {"count": 0}
+
+    def flaky(task):
+        calls["count"] += 1
+        if calls["count"] < 2:
+            raise Exception("Transient error")
+        return "ok"
+
+    queue = LocalTaskQueue(flaky, max_attempts=3)
+    queue.enqueue(MOCK_TOURNAMENTS[0])
+    assert queue.join()[0]["attempts"] == 2
+
+    failing = LocalTaskQueue(Mock(side_effect=Exception("Permanent error")), max_attempts=2)
+    failing.enqueue(MOCK_TOURNAMENTS[0])
+    result = failing.join()[0]
+    assert result["status"] == "error"
+    assert result["attempts"] == 2
+
+def test_pubsub_queue_round_trip():
+    """Published messages decode back into the task payload"""
+    publisher = Mock()
+    publisher.publish.return_value.result.return_value = "message-1"
+    queue = PubSubTaskQueue("projects/test/topics/fields", publisher=publisher)
+
+    dispatch_tournament_field_updates(MOCK_TOURNAMENTS[:1], queue)
+
+    assert queue.join() == ["message-1"]
+    topic, data = publisher.publish.call_args[0]
+    assert topic == "projects/test/topics/fields"
+
+    cloud_event = Mock(data={"message": {"data": base64.b64encode(data).decode()}})
+    assert decode_pubsub_task(cloud_event) == MOCK_TOURNAMENTS[0]
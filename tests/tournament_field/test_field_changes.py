@@ -0,0 +1,123 @@
+"""
+Tests for field change notifications
+"""
+
+import pytest
+from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from src.tournament_field.field_changes import (
+    diff_field, merge_pending, build_notification_batches, InMemoryChangeBuffer,
+    FirestoreChangeBuffer, FirestorePickerIndex, FieldChangeNotifier, ADDITION, WITHDRAWAL
+)
+
+NOW = datetime(2024, 5, 22, 12, 0, tzinfo=timezone.utc)
+
+def test_diff_field():
+    """Golfers leaving the field are withdrawals, new golfers additions"""
+    assert diff_field({"1", "2"}, {"2", "3"}) == {"1": WITHDRAWAL, "3": ADDITION}
+    assert diff_field({"1"}, {"1"}) == {}
+
+def test_merge_pending_holds_until_window_elapses():
+    """Events are buffered, then flushed once the window has passed"""
+    first = merge_pending({}, {"1": WITHDRAWAL}, NOW, window_seconds=600)
+    assert first["flushed"] == {}
+    assert first["state"]["window_started"] == NOW
+    assert first["state"]["flush_at"] == NOW + timedelta(minutes=10)
+
+    second = merge_pending(first["state"], {"2": ADDITION}, NOW + timedelta(minutes=5), 600)
+    assert second["flushed"] == {}
+
+    third = merge_pending(second["state"], {}, NOW + timedelta(minutes=10), 600)
+    assert third["flushed"] == {"1": WITHDRAWAL, "2": ADDITION}
+    assert third["state"] == {"pending": {}, "window_started": None, "flush_at": None}
+
+def test_merge_pending_cancels_opposite_events():
+    """A withdrawal reversed within the window produces no notification"""
+    first = merge_pending({}, {"1": WITHDRAWAL}, NOW, 600)
+    second = merge_pending(first["state"], {"1": ADDITION}, NOW + timedelta(minutes=1), 600)
+
+    assert second["flushed"] == {}
+    assert second["state"]["pending"] == {}
+
+def test_build_notification_batches():
+    """One notification per affected user, split into fixed-size batches"""
+    pickers = {"1": ["u1", "u2", "u3"], "2": ["u4"]}
+
+    batches = build_notification_batches(7, {"1": WITHDRAWAL, "2": ADDITION, "3": ADDITION}, pickers, batch_size=3)
+
+    assert [len(b["notifications"]) for b in batches] == [3, 1]
+    assert batches[0]["tournament_id"] == 7
+    assert batches[0]["notifications"][0] == {"user_id": "u1", "golfer_id": "1", "type": WITHDRAWAL}
+
+def test_picker_index_reads_only_changed_golfers():
+    """Pickers are resolved with a single batched read of the changed golfers"""
+    db = Mock()
+    db.collection.return_value.document.side_effect = lambda doc_id: doc_id
+    snapshot = Mock(exists=True, id="7_1")
+    snapshot.to_dict.return_value = {"user_ids": ["u1"]}
+    db.get_all.return_value = [snapshot]
+
+    pickers = FirestorePickerIndex(db).get_pickers(7, ["1", "2"])
+
+    assert pickers == {"1": ["u1"]}
+    db.get_all.assert_called_once_with(["7_1", "7_2"])
+
+def test_notifier_publishes_after_window():
+    """Changes are published in batches once the coalescing window closes"""
+    picker_index = Mock()
+    picker_index.get_pickers.return_value = {"1": ["u1"]}
+    queue = Mock()
+    notifier = FieldChangeNotifier(InMemoryChangeBuffer(window_seconds=600), picker_index, queue)
+
+    first = notifier.process(7, {"1", "2"}, {"2"}, now=NOW)
+    assert first == {"events": 1, "flushed": 0, "batches": 0}
+    queue.enqueue.assert_not_called()
+
+    second = notifier.process(7, {"2"}, {"2"}, now=NOW + timedelta(minutes=10))
+    assert second == {"events": 0, "flushed": 1, "batches": 1}
+    queue.enqueue.assert_called_once_with({
+        "tournament_id": 7,
+        "notifications": [{"user_id": "u1", "golfer_id": "1", "type": WITHDRAWAL}]
+    })
+    picker_index.get_pickers.assert_called_once()
+
+def test_notifier_skips_first_field():
+    """The first field for a tournament emits no additions"""
+    picker_index = Mock()
+    queue = Mock()
+    buffer = InMemoryChangeBuffer(window_seconds=0)
+    notifier = FieldChangeNotifier(buffer, picker_index, queue)
+
+    summary = notifier.process(7, set(), {"1", "2"}, now=NOW)
+
+    assert summary == {"events": 0, "flushed": 0, "batches": 0}
+    assert buffer.due_tournaments(NOW + timedelta(minutes=10)) == []
+    queue.enqueue.assert_not_called()
+    picker_index.get_pickers.assert_not_called()
+
+def test_notifier_flush_due_without_another_update():
+    """The scheduled flusher sends changes once the window closes, with no further field update"""
+    picker_index = Mock()
+    picker_index.get_pickers.return_value = {"1": ["u1"]}
+    queue = Mock()
+    notifier = FieldChangeNotifier(InMemoryChangeBuffer(window_seconds=600), picker_index, queue)
+    notifier.process(7, {"1", "2"}, {"2"}, now=NOW)
+
+    assert notifier.flush_due(now=NOW + timedelta(minutes=5)) == {"tournaments": 0, "flushed": 0, "batches": 0}
+    queue.enqueue.assert_not_called()
+
+    summary = notifier.flush_due(now=NOW + timedelta(minutes=10))
+    assert summary == {"tournaments": 1, "flushed": 1, "batches": 1}
+    queue.enqueue.assert_called_once_with({
+        "tournament_id": 7,
+        "notifications": [{"user_id": "u1", "golfer_id": "1", "type": WITHDRAWAL}]
+    })
+    assert notifier.flush_due(now=NOW + timedelta(minutes=11))["flushed"] == 0
+
+def test_firestore_buffer_due_tournaments():
+    """Due buffers are found with a single query on flush_at"""
+    db = Mock()
+    db.collection.return_value.where.return_value.stream.return_value = [Mock(id="7"), Mock(id="8")]
+
+    assert FirestoreChangeBuffer(db).due_tournaments(NOW) == [7, 8]
+    db.collection.assert_called_once_with("field_change_buffers")
@@ -6,7 +6,10 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 from google.cloud import firestore
-from src.tournament_field.firestore_client import store_tournament_field, get_tournament_field
+from src.tournament_field.firestore_client import (
+    store_tournament_field, get_tournament_field, publish_current_field, get_field_version,
+    get_published_field_version, get_tournament_field_hash
+)
 
 # Test data
 MOCK_TOURNAMENT_ID = "659"
@@ -27,6 +30,10 @@ MOCK_FIELD_DATA = {
         ]
     }
 }
+MOCK_PLAYERS = [
+    {"golfer_id": "1", "display_name": "Tyson Alexander", "photo_url": None,
+     "is_active": True, "is_alternate": False, "is_injured": False, "rank": 12}
+]
 
 @pytest.fixture
 def mock_db():
@@ -98,4 +105,89 @@ def test_get_tournament_field_error(mock_db):
     
     result = get_tournament_field(mock_client, MOCK_TOURNAMENT_ID)
     
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_publish_current_field_success(mock_db):
+    """Test field and version pointer are written in one batch"""
+    mock_client, mock_doc = mock_db
+    batch = mock_client.batch.return_value
+
+    version = publish_current_field(
+        mock_client, {"id": 1, "tour_id": 2, "tournament_name": "Charles Schwab Challenge"}, MOCK_PLAYERS
+    )
+
+    assert version == get_field_version(MOCK_PLAYERS)
+    mock_client.collection.assert_called_with("current_fields")
+    documents = [c[0][0] for c in mock_client.collection().document.call_args_list]
+    assert documents == ["1", "current_2"]
+    field_doc, pointer_doc = [c[0][1] for c in batch.set.call_args_list]
+    assert field_doc["players"] == MOCK_PLAYERS
+    assert field_doc["player_count"] == 1
+    assert pointer_doc == {"tournament_id": 1, "version": version, "last_updated": field_doc["last_updated"]}
+    batch.commit.assert_called_once()
+
+def test_publish_current_field_pointer_per_tour(mock_db):
+    """Concurrent workers on different tours write separate pointers"""
+    mock_client, mock_doc = mock_db
+
+    publish_current_field(mock_client, {"id": 1, "tour_id": 2}, MOCK_PLAYERS)
+    publish_current_field(mock_client, {"id": 2, "tour_id": 1}, MOCK_PLAYERS)
+    publish_current_field(mock_client, {"id": 3}, MOCK_PLAYERS)
+
+    documents = [c[0][0] for c in mock_client.collection().document.call_args_list]
+    assert documents == ["1", "current_2", "2", "current_1", "3", "current_2"]
+
+def test_publish_current_field_error(mock_db):
+    """Test error handling when publishing the current field"""
+    mock_client, mock_doc = mock_db
+    mock_client.batch.return_value.commit.side_effect = Exception("Firestore error")
+
+    assert publish_current_field(mock_client, {"id": 1}, MOCK_PLAYERS) is None
+
+def test_field_version_tracks_content():
+    """Versions are stable for identical fields and change with content"""
+    changed = [dict(MOCK_PLAYERS[0], is_active=False)]
+    assert get_field_version(MOCK_PLAYERS) == get_field_version([dict(MOCK_PLAYERS[0])])
+    assert get_field_version(MOCK_PLAYERS) != get_field_version(changed)
+
+def test_get_published_field_version(mock_db):
+    """Only the version field is requested"""
+    mock_client, mock_doc = mock_db
+    mock_doc.get.return_value.exists = True
+    mock_doc.get.return_value.to_dict.return_value = {"version": "abc123"}
+
+    assert get_published_field_version(mock_client, "1") == "abc123"
+    mock_doc.get.assert_called_once_with(field_paths=["version"])
+
+def test_get_published_field_version_not_found(mock_db):
+    """Test handling of an unpublished field"""
+    mock_client, mock_doc = mock_db
+    mock_doc.get.return_value.exists = False
+
+    assert get_published_field_version(mock_client, "1") is None
+
+def test_store_tournament_field_content_hash(mock_db):
+    """Stored fields carry a content hash for cache validation"""
+    mock_client, mock_doc = mock_db
+
+    store_tournament_field(mock_client, MOCK_TOURNAMENT_ID, MOCK_FIELD_DATA)
+
+    assert mock_doc.set.call_args[0][0]["content_hash"] == get_field_version(MOCK_FIELD_DATA)
+
+def test_get_tournament_field_hash(mock_db):
+    """Only the content hash is requested"""
+    mock_client, mock_doc = mock_db
+    mock_doc.get.return_value.exists = True
+    mock_doc.get.return_value.to_dict.return_value = {"content_hash": "abc123"}
+
+    assert get_tournament_field_hash(mock_client, MOCK_TOURNAMENT_ID) == "abc123"
+    mock_doc.get.assert_called_once_with(field_paths=["content_hash"])
+
+def test_get_tournament_field_hash_raise_errors(mock_db):
+    """Callers can tell a Firestore error apart from a missing field"""
+    mock_client, mock_doc = mock_db
+    mock_doc.get.side_effect = Exception("Firestore error")
+
+    assert get_tournament_field_hash(mock_client, MOCK_TOURNAMENT_ID) is None
+    with pytest.raises(Exception, match="Firestore error"):
+        get_tournament_field_hash(mock_client, MOCK_TOURNAMENT_ID, raise_errors=True)
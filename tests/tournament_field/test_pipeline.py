@@ -0,0 +1,99 @@
+"""
+Tests for the per-tournament field update pipeline
+"""
+
+import pytest
+from unittest.mock import Mock, patch, DEFAULT
+from src.tournament_field.pipeline import run_tournament_field_update
+from src.utils.profiling.memory_profiler import MemoryProfiler
+
+MOCK_TOURNAMENT = {"id": 1, "sportcontent_api_id": 659, "tournament_name": "Charles Schwab Challenge"}
+MOCK_FIELD_DATA = {"results": {"entry_list": [{"player_id": 100240}]}}
+
+@pytest.fixture
+def stages():
+    with patch.multiple(
+        'src.tournament_field.pipeline',
+        fetch_tournament_field=DEFAULT,
+        store_tournament_field=DEFAULT,
+        update_tournament_entries=DEFAULT,
+        fetch_owgr_ranks=DEFAULT,
+        get_current_field=DEFAULT,
+        publish_current_field=DEFAULT
+    ) as mocks:
+        mocks["fetch_tournament_field"].return_value = MOCK_FIELD_DATA
+        mocks["store_tournament_field"].return_value = True
+        mocks["update_tournament_entries"].return_value = True
+        mocks["fetch_owgr_ranks"].return_value = {}
+        mocks["get_current_field"].return_value = []
+        mocks["publish_current_field"].return_value = "abc123"
+        yield mocks
+
+def test_run_tournament_field_update_success(stages):
+    """All stages run for the tournament"""
+    session = Mock()
+    response, status = run_tournament_field_update(Mock(), session, MOCK_TOURNAMENT)
+
+    assert status == 200
+    assert response["field_version"] == "abc123"
+    stages["fetch_tournament_field"].assert_called_once_with(659)
+    stages["update_tournament_entries"].assert_called_once_with(session, 1, MOCK_FIELD_DATA, low_memory=False)
+
+def test_run_tournament_field_update_entries_failure(stages):
+    """A failed SQL update stops before publishing"""
+    stages["update_tournament_entries"].return_value = None
+
+    response, status = run_tournament_field_update(Mock(), Mock(), MOCK_TOURNAMENT)
+
+    assert status == 500
+    stages["publish_current_field"].assert_not_called()
+
+def test_run_tournament_field_update_without_rankings(stages):
+    """Rankings failures do not block publishing"""
+    stages["fetch_owgr_ranks"].side_effect = Exception("Quota exhausted")
+
+    response, status = run_tournament_field_update(Mock(), Mock(), MOCK_TOURNAMENT)
+
+    assert status == 200
+    assert stages["get_current_field"].call_args[0][2] == {}
+
+def test_run_tournament_field_update_memory_profile(stages):
+    """Enabled profiler reports every stage in the response"""
+    with MemoryProfiler() as profiler:
+        response, status = run_tournament_field_update(
+            Mock(), Mock(), MOCK_TOURNAMENT, low_memory=True, profiler=profiler
+        )
+
+    assert status == 200
+    assert set(response["memory_profile"]["stages"]) == {
+        "fetch", "store_firestore", "update_entries", "publish_current_field"
+    }
+    assert stages["update_tournament_entries"].call_args[1] == {"low_memory": True}
+
+def test_run_tournament_field_update_notifies_changes(stages):
+    """The notifier gets the field before and after the update"""
+    stages["get_current_field"].return_value = [{"golfer_id": "2"}, {"golfer_id": "3"}]
+    notifier = Mock()
+    with patch('src.tournament_field.pipeline.get_field_golfer_ids', return_value={"1", "2"}):
+        response, status = run_tournament_field_update(Mock(), Mock(), MOCK_TOURNAMENT, notifier=notifier)
+
+    assert status == 200
+    notifier.process.assert_called_once_with(1, {"1", "2"}, {"2", "3"})
+
+def test_run_tournament_field_update_notify_failure_is_not_fatal(stages):
+    """Notification errors do not fail the field update"""
+    notifier = Mock()
+    notifier.process.side_effect = Exception("Pub/Sub error")
+    with patch('src.tournament_field.pipeline.get_field_golfer_ids', return_value=set()):
+        response, status = run_tournament_field_update(Mock(), Mock(), MOCK_TOURNAMENT, notifier=notifier)
+
+    assert status == 200
+
+def test_run_tournament_field_update_previous_field_failure_is_not_fatal(stages):
+    """A failed read of the previous field skips notifications without failing the update"""
+    notifier = Mock()
+    with patch('src.tournament_field.pipeline.get_field_golfer_ids', side_effect=Exception("Database error")):
+        response, status = run_tournament_field_update(Mock(), Mock(), MOCK_TOURNAMENT, notifier=notifier)
+
+    assert status == 200
+    notifier.process.assert_not_called()
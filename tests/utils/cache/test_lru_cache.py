@@ -0,0 +1,50 @@
+import time
+from src.utils.cache.lru_cache import LRUCache
+
+#############################################################
+#                           TESTS                           #
+#############################################################
+def test_evicts_least_recently_used_by_count():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1, 1)
+    cache.set("b", 2, 1)
+    cache.get("a")
+    cache.set("c", 3, 1)
+
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+    assert cache.get("c").value == 3
+
+def test_evicts_by_size():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.set("a", "x", 60)
+    cache.set("b", "y", 60)
+
+    assert cache.get("a") is None
+    assert cache.size_bytes == 60
+
+def test_oversized_value_not_cached():
+    cache = LRUCache(max_bytes=10)
+    cache.set("a", "x", 11)
+    assert cache.get("a") is None
+    assert cache.size_bytes == 0
+
+def test_ttl_marks_stale_and_refresh_renews():
+    cache = LRUCache(ttl_seconds=0.01)
+    cache.set("a", 1, 1)
+    assert cache.get("a").fresh
+    time.sleep(0.02)
+
+    entry = cache.get("a")
+    assert entry is not None and not entry.fresh
+    cache.ttl_seconds = 60
+    cache.refresh("a")
+    assert cache.get("a").fresh
+
+def test_replace_and_invalidate_track_size():
+    cache = LRUCache()
+    cache.set("a", 1, 10)
+    cache.set("a", 2, 30)
+    assert cache.size_bytes == 30
+    cache.invalidate("a")
+    assert cache.size_bytes == 0 and len(cache) == 0
@@ -0,0 +1,123 @@
+import json
+import logging
+import threading
+import pytest
+from unittest.mock import Mock
+from google.api_core.exceptions import NotFound
+from src.utils.config.config import (
+    Config, ConfigError, FileSource, SecretManagerSource, get_config, build_source
+)
+
+
+@pytest.fixture
+def secrets_file(tmp_path):
+    path = tmp_path / "secrets.json"
+    path.write_text(json.dumps({"DB_PASS": "'file_pass'", "DATAGOLF_KEY": "dg_secret"}))
+    return path
+
+#############################################################
+#                           TESTS                           #
+#############################################################
+def test_get_caches_until_ttl(monkeypatch):
+    """Values are read from the source once per TTL"""
+    source = Mock(name="source")
+    source.get.return_value = '"value"'
+    config = Config(source, ttl_seconds=60)
+
+    assert config.get("KEY") == "value"
+    assert config.get("KEY") == "value"
+    assert source.get.call_count == 1
+
+    expired = Config(source, ttl_seconds=0)
+    expired.get("KEY")
+    expired.get("KEY")
+    assert source.get.call_count == 3
+
+def test_slow_fetch_does_not_block_other_keys():
+    """A slow source lookup only holds up callers of the same key"""
+    release = threading.Event()
+    fetching = threading.Event()
+
+    def get(key):
+        if key == "SLOW":
+            fetching.set()
+            release.wait(5)
+        return key.lower()
+
+    config = Config(Mock(get=get, name="source"))
+    slow = threading.Thread(target=config.get, args=("SLOW",))
+    slow.start()
+    assert fetching.wait(5)
+
+    assert config.get("FAST") == "fast"
+    release.set()
+    slow.join(5)
+    assert config.get("SLOW") == "slow"
+
+def test_file_source_falls_back_to_env(secrets_file, monkeypatch):
+    """Secrets come from the file; anything else comes from the environment"""
+    monkeypatch.setenv("DB_USER", "env_user")
+    config = Config(FileSource(str(secrets_file)))
+
+    assert config.get("DB_PASS") == "file_pass"
+    assert config.get("DB_USER") == "env_user"
+    assert config.get("MISSING", "default") == "default"
+
+def test_secret_manager_source():
+    """Latest secret version is read; missing secrets return None"""
+    client = Mock()
+    client.access_secret_version.return_value.payload.data = b"sm_secret"
+    source = SecretManagerSource("test-project", client=client)
+
+    assert source.get("DATAGOLF_KEY") == "sm_secret"
+    client.access_secret_version.assert_called_once_with(
+        name="projects/test-project/secrets/DATAGOLF_KEY/versions/latest"
+    )
+    client.access_secret_version.side_effect = NotFound("missing")
+    assert source.get("OTHER") is None
+
+def test_validate_names_missing_keys(monkeypatch):
+    """Validation lists every missing key"""
+    monkeypatch.delenv("DB_PASS", raising=False)
+    monkeypatch.delenv("DATAGOLF_KEY", raising=False)
+
+    with pytest.raises(ConfigError, match="DB_PASS, DATAGOLF_KEY"):
+        Config().validate("db", "datagolf")
+
+def test_secret_values_never_logged(secrets_file, caplog):
+    """Neither repr nor source errors expose values"""
+    config = Config(FileSource(str(secrets_file)))
+    config.get("DATAGOLF_KEY")
+    assert "dg_secret" not in repr(config)
+
+    failing = Mock(name="source")
+    failing.name = "secret_manager"
+    failing.get.side_effect = Exception("permission denied for dg_secret")
+    with caplog.at_level(logging.ERROR):
+        Config(failing).get("DATAGOLF_KEY")
+    assert "dg_secret" not in caplog.text
+
+def test_typed_getters(monkeypatch):
+    """Booleans and integers are parsed, bad integers rejected"""
+    monkeypatch.setenv("LOW_MEMORY_MODE", "True")
+    monkeypatch.setenv("DB_POOL_SIZE", "abc")
+    config = Config()
+
+    assert config.get_bool("LOW_MEMORY_MODE") is True
+    assert config.get_bool("UNSET_FLAG") is False
+    assert config.get_int("UNSET_INT", 5) == 5
+    with pytest.raises(ConfigError):
+        config.get_int("DB_POOL_SIZE", 5)
+
+def test_get_config_is_singleton(monkeypatch, secrets_file):
+    """One Config per instance, built from CONFIG_SOURCE"""
+    monkeypatch.setenv("CONFIG_SOURCE", "file")
+    monkeypatch.setenv("SECRETS_FILE", str(secrets_file))
+
+    assert get_config() is get_config()
+    assert get_config().source.name == "file"
+
+def test_unknown_config_source(monkeypatch):
+    monkeypatch.setenv("CONFIG_SOURCE", "vault")
+    with pytest.raises(ConfigError):
+        build_source()
@@ -0,0 +1,83 @@
+"""
+Tests for DataGolf API client functionality
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from src.utils.datagolf.datagolf_client import (
+    fetch_field_updates, fetch_rankings, fetch_predictions, fetch_owgr_ranks, DATAGOLF_URL
+)
+
+MOCK_FIELD_RESPONSE = {
+    "event_name": "Charles Schwab Challenge",
+    "field": [{"dg_id": 18417, "player_name": "Alexander, Tyson"}]
+}
+
+@pytest.fixture(autouse=True)
+def mock_budget():
+    with patch('src.utils.datagolf.datagolf_client.get_api_budget') as mock_get_budget:
+        yield mock_get_budget.return_value
+
+@pytest.fixture(autouse=True)
+def mock_api_key(monkeypatch):
+    monkeypatch.setenv("DATAGOLF_KEY", "test_key")
+
+@patch('requests.get')
+def test_fetch_field_updates_success(mock_get, mock_budget):
+    """Test successful field request"""
+    mock_get.return_value.json.return_value = MOCK_FIELD_RESPONSE
+
+    result = fetch_field_updates()
+
+    assert result == MOCK_FIELD_RESPONSE
+    mock_budget.acquire.assert_called_once()
+    url = mock_get.call_args[0][0]
+    params = mock_get.call_args[1]['params']
+    assert url == f"{DATAGOLF_URL}/field-updates"
+    assert params == {"tour": "pga", "file_format": "json", "key": "test_key"}
+
+@patch('requests.get')
+def test_fetch_rankings_and_predictions(mock_get, mock_budget):
+    """Rankings and predictions hit their endpoints and share the budget"""
+    fetch_rankings()
+    fetch_predictions(tour="euro")
+
+    urls = [c[0][0] for c in mock_get.call_args_list]
+    assert urls == [f"{DATAGOLF_URL}/preds/get-dg-rankings", f"{DATAGOLF_URL}/preds/pre-tournament"]
+    assert mock_get.call_args[1]['params']["tour"] == "euro"
+    assert mock_budget.acquire.call_count == 2
+
+@patch('requests.get')
+def test_fetch_field_updates_error(mock_get):
+    """Test API error handling"""
+    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        fetch_field_updates()
+
+@patch('requests.get')
+def test_fetch_error_never_exposes_key(mock_get, caplog):
+    """HTTP errors are logged and raised without the keyed URL"""
+    url = f"{DATAGOLF_URL}/preds/get-dg-rankings?file_format=json&key=test_key"
+    mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
+        f"403 Client Error: Forbidden for url: {url}", response=Mock(status_code=403)
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+        fetch_rankings()
+
+    assert "test_key" not in caplog.text
+    assert "test_key" not in str(exc_info.value)
+    assert "status 403" in str(exc_info.value)
+    assert exc_info.value.response.status_code == 403
+
+@patch('requests.get')
+def test_fetch_owgr_ranks(mock_get):
+    """Unranked players are dropped from the rank mapping"""
+    mock_get.return_value.json.return_value = {"rankings": [
+        {"dg_id": 18417, "owgr_rank": 12},
+        {"dg_id": 18418, "owgr_rank": None}
+    ]}
+
+    assert fetch_owgr_ranks() == {18417: 12}
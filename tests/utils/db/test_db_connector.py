@@ -2,11 +2,23 @@ import pytest
 import sqlalchemy
 import os
 from unittest.mock import patch, Mock
-from src.utils.db.db_connector import get_db_config, clean_env, get_db_connection, cleanup
 
+# The connector module creates its Cloud SQL and Firestore clients on import,
+# which needs Google credentials; stub them so the unit tests can be collected
+with patch('google.cloud.sql.connector.Connector'), patch('google.cloud.firestore.Client'):
+    from src.utils.db import db_connector
+    from src.utils.db.db_connector import get_db_config, get_db_connection, cleanup
+
+from src.utils.config.config import clean_value, reset_config
 from dotenv import load_dotenv
 
 
+@pytest.fixture(autouse=True)
+def reset_engines():
+    db_connector._engines.clear()
+    yield
+    db_connector._engines.clear()
+
 @pytest.fixture
 def mock_sql_connector():
     with patch('src.utils.db.db_connector.sql_connector') as mock_sql_connector:
@@ -27,11 +39,11 @@ def mock_env_vars(monkeypatch):
 #############################################################
 #                           TESTS                           #
 #############################################################
-def test_clean_env_strips_quotes():
-    """Ensure that quotes are stripped from environment variables"""
-    assert clean_env('TEST','"value"') == 'value'
-    assert clean_env('TEST',"'value'") == 'value'
-    assert clean_env('TEST','     value    ') == 'value'
+def test_clean_value_strips_quotes():
+    """Ensure that quotes are stripped from config values"""
+    assert clean_value('"value"') == 'value'
+    assert clean_value("'value'") == 'value'
+    assert clean_value('     value    ') == 'value'
     
 def test_db_config_loads_from_env(mock_env_vars):
     """Test that DB_CONFIG loads correctly from environment"""
@@ -67,6 +79,20 @@ def test_get_db_connection_success(mock_create_engine, mock_sql_connector, mock_
         db='test_db'
     )
 
+@patch('sqlalchemy.create_engine')
+def test_get_db_connection_uses_rotated_password(mock_create_engine, mock_sql_connector, mock_env_vars, monkeypatch):
+    """New connections pick up a rotated DB_PASS without a new engine"""
+    get_db_connection()
+    creator = mock_create_engine.call_args[1]['creator']
+    creator()
+
+    monkeypatch.setenv('DB_PASS', 'rotated_pass')
+    reset_config()
+    creator()
+
+    assert mock_sql_connector.connect.call_args[1]['password'] == 'rotated_pass'
+    assert mock_create_engine.call_count == 1
+
 @patch('sqlalchemy.create_engine')
 def test_get_db_connection_failure(mock_create_engine, mock_sql_connector, mock_env_vars):
     """test db connection failure"""
@@ -117,4 +143,28 @@ def test_integration():
     except Exception as e:
         pytest.fail(f"Integration test failed: {e}")
     finally:
-        cleanup()
\ No newline at end of file
+        cleanup()
+
+@patch('sqlalchemy.create_engine')
+def test_get_db_connection_pool_config(mock_create_engine, mock_sql_connector, mock_env_vars, monkeypatch):
+    """Pool sizing comes from config, with explicit arguments taking precedence"""
+    monkeypatch.setenv('DB_POOL_SIZE', '1')
+    monkeypatch.setenv('DB_MAX_OVERFLOW', '0')
+
+    get_db_connection()
+    kwargs = mock_create_engine.call_args[1]
+    assert (kwargs['pool_size'], kwargs['max_overflow'], kwargs['pool_timeout']) == (1, 0, 30)
+
+    get_db_connection(pool_size=3)
+    assert mock_create_engine.call_args[1]['pool_size'] == 3
+
+@patch('sqlalchemy.create_engine')
+def test_get_db_connection_reuses_engine(mock_create_engine, mock_sql_connector, mock_env_vars):
+    """Invocations on one instance share a single engine and pool"""
+    assert get_db_connection() is get_db_connection()
+    assert mock_create_engine.call_count == 1
+
+    cleanup()
+    mock_create_engine.return_value.dispose.assert_called_once()
+    get_db_connection()
+    assert mock_create_engine.call_count == 2
@@ -0,0 +1,30 @@
+import tracemalloc
+from src.utils.profiling.memory_profiler import MemoryProfiler
+
+#############################################################
+#                           TESTS                           #
+#############################################################
+def test_stage_records_peak_and_retained():
+    """Peak covers temporary allocations; retained only what survives the stage"""
+    with MemoryProfiler() as profiler:
+        with profiler.stage("temporary"):
+            data = [bytearray(1024) for _ in range(1000)]
+            del data
+        with profiler.stage("kept"):
+            kept = [bytearray(1024) for _ in range(1000)]
+        report = profiler.report()
+
+    assert report["stages"]["temporary"]["peak_kb"] > 900
+    assert report["stages"]["temporary"]["retained_kb"] < 100
+    assert report["stages"]["kept"]["retained_kb"] > 900
+    assert report["max_rss_kb"] > 0
+    assert not tracemalloc.is_tracing()
+    assert kept
+
+def test_disabled_profiler_is_noop():
+    """Disabled profiler neither traces nor records stages"""
+    with MemoryProfiler(enabled=False) as profiler:
+        with profiler.stage("fetch"):
+            assert not tracemalloc.is_tracing()
+
+    assert profiler.stages == {}
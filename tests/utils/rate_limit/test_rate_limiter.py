@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import Mock, patch
+from src.utils.rate_limit import rate_limiter
+from src.utils.rate_limit.rate_limiter import (
+    TokenBucket, DailyQuota, FirestoreDailyQuota, ApiBudget, QuotaExceededError,
+    get_api_budget, use_firestore_quotas
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_budgets():
+    rate_limiter._budgets.clear()
+    yield
+    rate_limiter._budgets.clear()
+
+#############################################################
+#                           TESTS                           #
+#############################################################
+def test_token_bucket_allows_burst_then_times_out():
+    """Capacity tokens are available immediately, then callers wait for refill"""
+    bucket = TokenBucket(rate=0.01, capacity=3)
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    assert bucket.acquire(timeout=0.01) is False
+
+def test_token_bucket_refills():
+    """Tokens refill at the configured rate"""
+    bucket = TokenBucket(rate=100, capacity=1)
+    assert bucket.acquire(timeout=0)
+    assert bucket.acquire(timeout=1)
+
+def test_daily_quota_limit_and_reset():
+    """Quota stops at the limit and resets on a new UTC day"""
+    quota = DailyQuota(limit=2)
+    assert quota.consume() and quota.consume()
+    assert quota.consume() is False
+
+    with patch.object(rate_limiter, "_today", return_value="2099-01-01"):
+        assert quota.consume()
+
+def test_daily_quota_unlimited():
+    """A None limit never runs out"""
+    quota = DailyQuota(limit=None)
+    assert all(quota.consume() for _ in range(1000))
+
+def test_firestore_quota_leases_blocks():
+    """Units are reserved from Firestore a block at a time"""
+    quota = FirestoreDailyQuota(Mock(), "sportcontent", limit=100, block_size=10)
+    with patch.object(quota, "_reserve", return_value=10) as mock_reserve:
+        assert all(quota.consume() for _ in range(10))
+        assert mock_reserve.call_count == 1
+        assert quota.consume()
+        assert mock_reserve.call_count == 2
+
+def test_firestore_quota_exhausted():
+    """Consume fails when the shared counter grants nothing"""
+    quota = FirestoreDailyQuota(Mock(), "sportcontent", limit=100)
+    with patch.object(quota, "_reserve", return_value=0):
+        assert quota.consume() is False
+
+def test_firestore_quota_error_falls_back_to_instance_share():
+    """Firestore errors count against this instance's share instead of denying"""
+    quota = FirestoreDailyQuota(Mock(), "sportcontent", limit=100, fallback_limit=2)
+    with patch.object(quota, "_reserve", side_effect=Exception("Firestore error")):
+        assert quota.consume() and quota.consume()
+        assert quota.consume() is False
+
+def test_firestore_quota_default_fallback_is_a_share_of_the_limit():
+    """Without an explicit share, the fallback is a fraction of the daily limit"""
+    quota = FirestoreDailyQuota(Mock(), "sportcontent", limit=2000)
+    assert quota._fallback.limit == 2000 // rate_limiter.DEFAULT_FALLBACK_INSTANCES
+
+def test_firestore_quota_unlimited_skips_firestore():
+    """A None limit never touches Firestore"""
+    db = Mock()
+    quota = FirestoreDailyQuota(db, "datagolf", limit=None)
+    assert all(quota.consume() for _ in range(100))
+    db.transaction.assert_not_called()
+
+def test_use_firestore_quotas_only_for_limited_apis():
+    """APIs without a daily limit keep the in-memory quota"""
+    use_firestore_quotas(Mock())
+    assert isinstance(get_api_budget("sportcontent").quota, FirestoreDailyQuota)
+    assert isinstance(get_api_budget("datagolf").quota, DailyQuota)
+
+def test_limits_come_from_config(monkeypatch):
+    """Rates, burst sizes, daily limits and the fallback share are configurable"""
+    monkeypatch.setenv("SPORTCONTENT_RATE_PER_SECOND", "0.5")
+    monkeypatch.setenv("SPORTCONTENT_BURST", "2")
+    monkeypatch.setenv("SPORTCONTENT_DAILY_LIMIT", "500")
+    monkeypatch.setenv("QUOTA_FALLBACK_INSTANCES", "5")
+
+    budget = get_api_budget("sportcontent")
+    assert (budget.bucket.rate, budget.bucket.capacity, budget.quota.limit) == (0.5, 2, 500)
+
+    use_firestore_quotas(Mock())
+    assert budget.quota.limit == 500
+    assert budget.quota._fallback.limit == 100
+
+def test_api_budget_raises_when_quota_exhausted():
+    """Exhausted quota raises without taking a rate limit token"""
+    bucket = Mock()
+    budget = ApiBudget("datagolf", bucket, DailyQuota(limit=0))
+    with pytest.raises(QuotaExceededError):
+        budget.acquire()
+    bucket.acquire.assert_not_called()
+
+def test_get_api_budget_is_shared():
+    """All callers get the same budget instance per API"""
+    assert get_api_budget("datagolf") is get_api_budget("datagolf")
+    assert get_api_budget("datagolf") is not get_api_budget("sportcontent")